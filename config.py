@@ -7,6 +7,7 @@ LOG_LEVEL = 'INFO'  # Changed from ERROR to INFO to see debug logs
 LOG_SELENIUM_LEVEL = ERROR
 LOG_TO_FILE = True  # Changed to True to save logs
 LOG_TO_CONSOLE = True  # Changed to True to see logs in terminal
+LOG_SERIALIZE = False  # Set to True to also write structured JSON logs to log/app.jsonl
 
 MINIMUM_WAIT_TIME_IN_SECONDS = 60
 
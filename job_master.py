@@ -52,6 +52,7 @@ from src.resume_schemas.resume import Resume
 from src.libs.resume_and_cover_builder.moderndesign1.modern_facade import ModernDesign1Facade
 from src.libs.resume_and_cover_builder.moderndesign1.modern_style_manager import ModernDesign1StyleManager
 from src.libs.resume_and_cover_builder.moderndesign1.modern_resume_generator import ModernDesign1ResumeGenerator
+from src.utils.chrome_utils import save_pdf_to_output
 
 # Browser pool support
 try:
@@ -1428,8 +1429,7 @@ class JobMaster:
 
             _cv_design_slug = os.getenv("CV_DESIGN", "design_01_minimal")
             cv_path = job_folder / f"CV_{safe_company}_{safe_title}_{_cv_design_slug}.pdf"
-            with open(cv_path, 'wb') as f:
-                f.write(base64.b64decode(cv_base64))
+            save_pdf_to_output(cv_path, base64.b64decode(cv_base64))
 
             print(f"✅ CV sparat: {cv_path.name} ({cv_path.stat().st_size / 1024:.1f} KB)")
 
@@ -1438,8 +1438,7 @@ class JobMaster:
             cover_base64, _ = self.modern_facade.create_cover_letter()
 
             cover_path = job_folder / f"Personligt_Brev_{safe_company}_{safe_title}_{_cv_design_slug}.pdf"
-            with open(cover_path, 'wb') as f:
-                f.write(base64.b64decode(cover_base64))
+            save_pdf_to_output(cover_path, base64.b64decode(cover_base64))
 
             print(f"✅ Personligt brev sparat: {cover_path.name} ({cover_path.stat().st_size / 1024:.1f} KB)")
 
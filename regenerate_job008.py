@@ -64,7 +64,7 @@ def main():
         driver = get_browser()
     except Exception:
         from src.utils.chrome_utils import init_browser
-        driver = init_browser()
+        driver = init_browser(headless=True)
     print("Chrome OK")
 
     from src.libs.resume_and_cover_builder.moderndesign1.modern_facade import ModernDesign1Facade
@@ -13,7 +13,7 @@ from src.job_scrapers import JobScraperManager, JobListing
 from src.email_sender import EmailSender
 from src.libs.resume_and_cover_builder import ResumeFacade, ResumeGenerator, StyleManager
 from src.resume_schemas.resume import Resume
-from src.utils.chrome_utils import init_browser
+from src.utils.chrome_utils import init_browser, save_pdf_to_output
 import base64
 
 
@@ -231,11 +231,8 @@ class ApplyMindAI:
             resume_path = job_output_dir / "resume_tailored.pdf"
             cover_letter_path = job_output_dir / "cover_letter_tailored.pdf"
             
-            with open(resume_path, "wb") as file:
-                file.write(base64.b64decode(resume_base64))
-            
-            with open(cover_letter_path, "wb") as file:
-                file.write(base64.b64decode(cover_letter_base64))
+            save_pdf_to_output(resume_path, base64.b64decode(resume_base64))
+            save_pdf_to_output(cover_letter_path, base64.b64decode(cover_letter_base64))
             
             logger.info(f"Documents generated for {job.company} - {job.title}")
             return resume_path, cover_letter_path
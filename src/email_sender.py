@@ -26,6 +26,10 @@ except ImportError:
     SecurePasswordManager = None
 
 
+# Header-injection characters mapped to spaces (single C-level pass via str.translate)
+_SANITIZE_TABLE = str.maketrans("\n\r\0\x0b\x0c", "     ")
+
+
 class EmailSender:
     """Handles automated email sending for job applications."""
 
@@ -236,17 +240,9 @@ class EmailSender:
         if not text:
             return ""
 
-        # Remove newlines, carriage returns, and null bytes
-        dangerous_chars = ['\n', '\r', '\0', '\x0b', '\x0c']
-        sanitized = text
-        for char in dangerous_chars:
-            sanitized = sanitized.replace(char, ' ')
-
-        # Remove consecutive spaces
-        while '  ' in sanitized:
-            sanitized = sanitized.replace('  ', ' ')
-
-        return sanitized.strip()
+        # Replace newlines, carriage returns and null bytes with spaces, then
+        # collapse whitespace runs (split/join also strips the ends)
+        return " ".join(text.translate(_SANITIZE_TABLE).split())
 
     def _create_email_body(self, company_name: str, position_title: str, custom_message: Optional[str] = None) -> str:
         """
@@ -21,6 +21,13 @@ from loguru import logger
 # Import security utilities for SSRF protection
 from src.security_utils import SecurityValidator
 
+# lxml (C parser) is several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 
 @dataclass
 class JobListing:
@@ -174,7 +181,7 @@ class TheHubScraper(JobScraperBase):
             # Framework Rule: requests library best practice - always set timeout
             # Impact: Prevents application hang on slow/unresponsive servers
             response = requests.get(job_url, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
 
             # Extract job details with proper None handling (Python idiom)
             title_elem = soup.find('h1', class_='job-title')
@@ -241,7 +248,7 @@ class ArbetsformedlingenScraper(JobScraperBase):
             # Framework Rule: requests library best practice - always set timeout
             # Impact: Prevents application hang on slow/unresponsive servers
             response = requests.get(job_url, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
 
             # Extract title with proper None handling (Python idiom)
             title_elem = soup.find('h1', class_='job-title') or soup.find('h1')
@@ -384,7 +384,7 @@ class ModelAwareResumeSystem:
             )
         
         # 3. Konvertera till PDF
-        driver = init_browser()
+        driver = init_browser(headless=True)
         try:
             result_base64 = HTML_to_PDF(html_content, driver)
             logger.info(f"PDF genererat framgångsrikt: {suggested_name}")
@@ -3,9 +3,8 @@ import os
 import sys
 import logging
 from loguru import logger
-from selenium.webdriver.remote.remote_connection import LOGGER as selenium_logger
 
-from config import LOG_LEVEL, LOG_SELENIUM_LEVEL, LOG_TO_CONSOLE, LOG_TO_FILE
+from config import LOG_LEVEL, LOG_SELENIUM_LEVEL, LOG_TO_CONSOLE, LOG_TO_FILE, LOG_SERIALIZE
 
 
 def remove_default_loggers():
@@ -44,6 +43,18 @@ def init_loguru_logger():
             diagnose=True,
         )
 
+    # Add structured JSON logger if LOG_SERIALIZE is True
+    if LOG_SERIALIZE:
+        # loguru's own serializer keeps exception and extra data; same rotation as app.log
+        logger.add(
+            "log/app.jsonl",
+            level=LOG_LEVEL,
+            serialize=True,
+            rotation="10 MB",
+            retention="1 week",
+            compression="zip",
+        )
+
     # Add console logger if LOG_TO_CONSOLE is True
     if LOG_TO_CONSOLE:
         logger.add(
@@ -57,6 +68,9 @@ def init_loguru_logger():
 
 def init_selenium_logger():
     """Initialize and configure selenium logger to write to selenium.log."""
+    # Same logger object as selenium.webdriver.remote.remote_connection.LOGGER,
+    # looked up by name so selenium isn't imported just to configure logging
+    selenium_logger = logging.getLogger("selenium.webdriver.remote.remote_connection")
     log_file = "log/selenium.log"
     os.makedirs(os.path.dirname(log_file), exist_ok=True)
 
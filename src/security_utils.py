@@ -4,6 +4,9 @@ Handles sensitive data validation and sanitization
 """
 import re
 import os
+import socket
+import functools
+import ipaddress
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
@@ -16,14 +19,50 @@ try:
     env_path = Path(__file__).parent.parent / '.env'
     if env_path.exists():
         load_dotenv(dotenv_path=env_path)
-        logger.debug(f"✅ Loaded environment variables from {env_path}")
+        logger.debug("✅ Loaded environment variables from {}", env_path)
     else:
         load_dotenv()  # Try to load from default locations
         logger.debug("Looking for .env file in current directory")
 except ImportError:
     logger.warning("python-dotenv not installed. Using system environment variables only.")
 except Exception as e:
-    logger.warning(f"Could not load .env file: {e}")
+    logger.warning("Could not load .env file: {}", e)
+
+
+# Characters that enable header/shell injection in email addresses
+_EMAIL_DANGEROUS_RE = re.compile(r"[|;&$`\n\r]")
+
+# Redaction rules for sanitize_for_logging, combined into one alternation so the
+# text is scanned once. Where several rules match at the same position the first
+# alternative wins, matching the order the rules used to be applied in.
+_SANITIZE_RE = re.compile(
+    r"""
+    (?P<api>sk-[a-zA-Z0-9]{20,})                                          # API keys
+  | (?P<api_key>api[_-]?key["']?\s*[:=]\s*["']?[a-zA-Z0-9_-]+)
+  | (?P<password>password["']?\s*[:=]\s*["']?[^\s"']+)                  # Passwords
+  | (?P<pwd>pwd["']?\s*[:=]\s*["']?[^\s"']+)
+  | (?P<token>token["']?\s*[:=]\s*["']?[a-zA-Z0-9_-]{20,})               # Tokens
+  | (?P<bearer>bearer\s+[a-zA-Z0-9_-]+)
+  | (?P<email>(?P<local>[a-zA-Z0-9._%+-]+)@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})  # Emails (partial)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_SANITIZE_REPLACEMENTS = {
+    'api': '[API_KEY_REDACTED]',
+    'api_key': 'api_key=[REDACTED]',
+    'password': 'password=[REDACTED]',
+    'pwd': 'pwd=[REDACTED]',
+    'token': 'token=[REDACTED]',
+    'bearer': 'bearer [REDACTED]',
+}
+
+
+def _sanitize_repl(match: re.Match) -> str:
+    """Replacement for the rule that matched; emails keep their local part."""
+    if match.lastgroup == 'email':
+        return f"{match.group('local')}@[REDACTED]"
+    return _SANITIZE_REPLACEMENTS[match.lastgroup]
 
 
 class SecurityValidator:
@@ -37,6 +76,12 @@ class SecurityValidator:
     # Allowed URL schemes for job URLs
     ALLOWED_URL_SCHEMES = {'http', 'https'}
     
+    # RFC 5321 max email length (64 local + @ + 255 domain)
+    MAX_EMAIL_LENGTH = 320
+    
+    # Longest URL accepted (common browser/server limit)
+    MAX_URL_LENGTH = 2048
+    
     @classmethod
     def validate_email(cls, email: str) -> bool:
         """
@@ -54,27 +99,13 @@ class SecurityValidator:
         if not email or not isinstance(email, str):
             raise ValueError("Email must be a non-empty string")
 
-        # SECURITY FIX #1: Check for dangerous characters BEFORE any other validation
-        # This prevents injection attacks from bypassing regex validation
-        dangerous_chars = ['|', ';', '&', '$', '`', chr(10), chr(13)]  # chr(10)=newline, chr(13)=carriage return
-        if any(char in email for char in dangerous_chars):
-            raise ValueError("Email contains invalid characters")
-
-        # SECURITY FIX #2: Check length BEFORE stripping (prevent bypass with whitespace)
-        # RFC 5321 specifies maximum 320 characters (64 local + @ + 255 domain)
-        if len(email) > 320:  # RFC 5321 max length
-            raise ValueError("Email address too long (max 320 characters)")
+        # SECURITY FIX #2: Check length BEFORE stripping (prevent bypass with whitespace).
+        # Done before any regex work and before the cache, so oversized input is
+        # rejected in O(1) and never fills the memo table.
+        if len(email) > cls.MAX_EMAIL_LENGTH:
+            raise ValueError(f"Email address too long (max {cls.MAX_EMAIL_LENGTH} characters)")
 
-        email = email.strip()
-
-        # Validate email format with regex
-        if not cls.EMAIL_REGEX.match(email):
-            raise ValueError(
-                f"Invalid email format: '{email}'. "
-                "Please use format: user@example.com"
-            )
-        
-        logger.debug(f"Email validation passed: {email}")
+        _validate_email_impl(email)
         return True
 
     @classmethod
@@ -94,6 +125,9 @@ class SecurityValidator:
         if not url or not isinstance(url, str):
             raise ValueError("URL must be a non-empty string")
         
+        if len(url) > cls.MAX_URL_LENGTH:
+            raise ValueError(f"URL too long (max {cls.MAX_URL_LENGTH} characters)")
+        
         url = url.strip()
         
         try:
@@ -109,34 +143,62 @@ class SecurityValidator:
                 f"This prevents file:// and javascript: attacks."
             )
         
-        # Check for hostname
-        if not parsed.netloc:
+        # Check for hostname (parsed.hostname drops userinfo, port and IPv6 brackets)
+        hostname = parsed.hostname
+        if not hostname:
             raise ValueError(
                 f"Invalid URL: missing hostname. URL: {url}"
             )
         
         # Check for localhost/internal IPs (SSRF protection)
-        localhost_patterns = [
-            'localhost',
-            '127.0.0.1',
-            '0.0.0.0',
-            '::1',
-            '169.254.',  # Link-local
-            '10.',       # Private Class A
-            '192.168.',  # Private Class C
-        ]
+        _validate_url_host(parsed.scheme, hostname.rstrip('.'))
+
+        logger.debug("URL validation passed: {}", url)
+        return True
+
+    @classmethod
+    def validate_resolved_url(cls, url: str) -> bool:
+        """
+        Validate a URL the application itself is about to fetch.
+        
+        Runs validate_job_url and additionally resolves the hostname, so DNS
+        names pointing at internal addresses are rejected too.
         
-        hostname = parsed.netloc.lower()
-        for pattern in localhost_patterns:
-            if pattern in hostname:
-                logger.warning(f"Blocked internal URL: {url}")
+        Raises:
+            ValueError: If the URL is invalid, does not resolve, or resolves
+                to an internal address
+        """
+        cls.validate_job_url(url)
+        hostname = urlparse(url.strip()).hostname.rstrip('.')
+        try:
+            infos = socket.getaddrinfo(hostname, None)
+        except (socket.gaierror, UnicodeError) as e:
+            raise ValueError(f"Could not resolve host: {hostname}") from e
+        for info in infos:
+            if not cls.is_public_address(info[4][0]):
+                logger.warning("Blocked URL resolving to internal address: {}", url)
                 raise ValueError(
                     f"Internal/localhost URLs are not allowed for security reasons"
                 )
-        
-        logger.debug(f"URL validation passed: {url}")
         return True
-    
+
+    @staticmethod
+    def is_public_address(address: str) -> bool:
+        """
+        Check that an IP address string (e.g. a socket peer) is publicly routable.
+        
+        Returns:
+            bool: False for internal, non-global or unparseable addresses
+        """
+        ip = _parse_ip(address.split('%', 1)[0])
+        return ip is not None and not _is_internal_ip(ip)
+
+    @staticmethod
+    def clear_validation_cache() -> None:
+        """Clear the memoized email/URL validation results."""
+        _validate_email_impl.cache_clear()
+        _validate_url_host.cache_clear()
+
     @classmethod
     def sanitize_for_logging(cls, text: str, sensitive_patterns: Optional[list] = None) -> str:
         """
@@ -152,37 +214,88 @@ class SecurityValidator:
         if not text:
             return text
         
-        sanitized = text
+        # All default rules in a single pass
+        sanitized = _SANITIZE_RE.sub(_sanitize_repl, text)
         
-        # Default patterns to redact
-        default_patterns = [
-            # API keys
-            (r'sk-[a-zA-Z0-9]{20,}', '[API_KEY_REDACTED]'),
-            (r'api[_-]?key["\']?\s*[:=]\s*["\']?([a-zA-Z0-9_-]+)', 'api_key=[REDACTED]'),
-            
-            # Passwords
-            (r'password["\']?\s*[:=]\s*["\']?([^\s"\']+)', 'password=[REDACTED]'),
-            (r'pwd["\']?\s*[:=]\s*["\']?([^\s"\']+)', 'pwd=[REDACTED]'),
-            
-            # Tokens
-            (r'token["\']?\s*[:=]\s*["\']?([a-zA-Z0-9_-]{20,})', 'token=[REDACTED]'),
-            (r'bearer\s+([a-zA-Z0-9_-]+)', 'bearer [REDACTED]'),
-            
-            # Email addresses (partial redaction)
-            (r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', r'\1@[REDACTED]'),
-        ]
-        
-        # Add custom patterns
+        # Custom patterns (re caches their compiled form)
         if sensitive_patterns:
-            default_patterns.extend(sensitive_patterns)
-        
-        # Apply all patterns
-        for pattern, replacement in default_patterns:
-            sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
+            for pattern, replacement in sensitive_patterns:
+                sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
         
         return sanitized
 
 
+@functools.lru_cache(maxsize=4096)
+def _validate_email_impl(email: str) -> None:
+    """Pure email checks behind SecurityValidator.validate_email (memoized; raises are not cached)."""
+    # SECURITY FIX #1: Check for dangerous characters BEFORE any other validation
+    # This prevents injection attacks from bypassing regex validation
+    if _EMAIL_DANGEROUS_RE.search(email):
+        raise ValueError("Email contains invalid characters")
+
+    email = email.strip()
+
+    # Validate email format with regex
+    if not SecurityValidator.EMAIL_REGEX.match(email):
+        raise ValueError(
+            f"Invalid email format: '{email}'. "
+            "Please use format: user@example.com"
+        )
+
+    logger.debug("Email validation passed: {}", email)
+
+
+def _parse_ip(hostname: str):
+    """Return hostname as an IPv4Address/IPv6Address, or None for DNS names."""
+    try:
+        return ipaddress.ip_address(hostname)
+    except ValueError:
+        pass
+    try:
+        # Legacy IPv4 spellings that browsers still resolve (2130706433, 0x7f.1, 127.1)
+        return ipaddress.IPv4Address(socket.inet_aton(hostname))
+    except OSError:
+        return None
+
+
+def _is_internal_ip(ip) -> bool:
+    """True for addresses that must never be fetched (loopback, private, link-local, CGNAT, ...)."""
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        return _is_internal_ip(ip.ipv4_mapped)
+    return (
+        ip.is_private
+        or ip.is_loopback
+        or ip.is_link_local
+        or ip.is_multicast
+        or ip.is_reserved
+        or ip.is_unspecified
+        # Catches ranges none of the flags above cover, e.g. 100.64.0.0/10 (CGNAT,
+        # used for cloud metadata such as 100.100.100.200)
+        or not ip.is_global
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_url_host(scheme: str, hostname: str) -> None:
+    """
+    SSRF host check behind SecurityValidator.validate_job_url.
+
+    Keyed on (scheme, hostname) only so that paths and query strings
+    don't multiply cache entries. IP literals are classified with
+    ipaddress; DNS names are not resolved.
+    """
+    ip = _parse_ip(hostname)
+    if (
+        hostname == 'localhost'
+        or hostname.endswith('.localhost')
+        or (ip is not None and _is_internal_ip(ip))
+    ):
+        logger.warning("Blocked internal URL host: {}://{}", scheme, hostname)
+        raise ValueError(
+            f"Internal/localhost URLs are not allowed for security reasons"
+        )
+
+
 class SecurePasswordManager:
     """
     Manages passwords securely using environment variables.
@@ -4,9 +4,102 @@ Analyserar jobbeskrivning och genererar relevanta frågor för CV-anpassning
 """
 
 from openai import OpenAI
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from loguru import logger
+import io
 import json
+import sys
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+if MSGSPEC_AVAILABLE:
+    # LLM:en skriver ibland siffror eller null i textfälten - acceptera dem i stället för att kasta
+    LenientText = Union[str, int, float, None]
+
+    class Question(msgspec.Struct):
+        """Schema för en genererad fråga"""
+        question: LenientText
+        context: LenientText = ""
+        metric_type: LenientText = "text"
+        example_answer: LenientText = ""
+
+    class QuestionSet(msgspec.Struct):
+        """Schema för LLM-svaret från analyze_job_and_generate_questions"""
+        job_focus: LenientText = "Okänd"
+        questions: List[Question] = []
+
+
+# Korta jobbeskrivningar ger korta svar - begränsa max_tokens för lägre latens
+SHORT_JOB_DESCRIPTION_CHARS = 500
+SHORT_MAX_TOKENS = 500
+DEFAULT_MAX_TOKENS = 1200
+
+
+def _read_json_stream(stream) -> str:
+    """
+    Läs ett strömmat chat-svar och sluta så fort JSON-objektet är komplett.
+
+    Räknar klamrar utanför strängar; när det yttersta objektet stängs
+    avbryts strömmen så att resten av svaret inte behöver läsas.
+    """
+    parts = []
+    depth = 0
+    started = False
+    in_string = False
+    escaped = False
+
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            text = chunk.choices[0].delta.content or ""
+            parts.append(text)
+
+            for ch in text:
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == "\\":
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch == "{":
+                    depth += 1
+                    started = True
+                elif ch == "}":
+                    depth -= 1
+
+            if started and depth == 0:
+                break
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+
+    return "".join(parts)
+
+
+def _parse_questions_json(raw: str) -> Dict:
+    """Parsa och validera LLM-svaret (orjson/msgspec om tillgängliga)"""
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    if MSGSPEC_AVAILABLE:
+        # Kastar msgspec.ValidationError om schemat inte stämmer; returnera den
+        # normaliserade formen (standardvärden ifyllda, okända fält bortplockade)
+        return msgspec.to_builtins(msgspec.convert(data, QuestionSet))
+    return data
 
 
 class SmartQuestionGenerator:
@@ -77,8 +170,10 @@ OUTPUT FORMAT (JSON):
 
 Generate the questions:"""
 
+        max_tokens = SHORT_MAX_TOKENS if len(job_description) < SHORT_JOB_DESCRIPTION_CHARS else DEFAULT_MAX_TOKENS
+
         try:
-            response = self.client.chat.completions.create(
+            stream = self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -91,20 +186,21 @@ Generate the questions:"""
                     }
                 ],
                 temperature=0.5,
-                max_tokens=1200,
-                response_format={"type": "json_object"}
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+                stream=True
             )
 
-            result = response.choices[0].message.content
-            data = json.loads(result)
+            result = _read_json_stream(stream)
+            data = _parse_questions_json(result)
 
-            logger.info(f"✅ Genererade {len(data.get('questions', []))} frågor")
-            logger.info(f"🎯 Jobbfokus: {data.get('job_focus', 'Okänd')}")
+            logger.opt(lazy=True).info("✅ Genererade {} frågor", lambda: len(data.get('questions', [])))
+            logger.info("🎯 Jobbfokus: {}", data.get('job_focus', 'Okänd'))
 
             return data
 
         except Exception as e:
-            logger.error(f"❌ Fel vid frågegenerering: {e}")
+            logger.error("❌ Fel vid frågegenerering: {}", e)
             # Fallback till generiska frågor
             return self._get_fallback_questions()
 
@@ -160,6 +256,9 @@ Generate the questions:"""
         """
         Ställ frågor interaktivt till användaren
 
+        Om stdin inte är en terminal (t.ex. CI eller förifylld pipe) skrivs alla
+        frågor ut på en gång och svaren läses rad för rad från stdin.
+
         Args:
             questions_data: Data från analyze_job_and_generate_questions
 
@@ -167,6 +266,9 @@ Generate the questions:"""
             Dictionary med svar
         """
 
+        if not sys.stdin.isatty():
+            return self._ask_questions_batched(questions_data)
+
         print("\n" + "="*80)
         print("🎯 JOBBANPASSADE FRÅGOR")
         print("="*80)
@@ -211,6 +313,46 @@ Generate the questions:"""
 
         return answers
 
+    def _ask_questions_batched(self, questions_data: Dict) -> Dict:
+        """Skriv alla frågor i ett svep och läs svaren positionellt från stdin"""
+
+        questions = questions_data.get('questions', [])
+        separator = "=" * 80
+
+        buf = io.StringIO()
+        buf.write(f"\n{separator}\n🎯 JOBBANPASSADE FRÅGOR\n{separator}\n")
+        buf.write(f"Detta jobb fokuserar på: {questions_data.get('job_focus', 'Okänd')}\n")
+        buf.write(f"\n💡 Svaren läses rad för rad från stdin (tom rad = hoppa över).\n{separator}\n\n")
+
+        for i, q_data in enumerate(questions, 1):
+            buf.write(f"❓ FRÅGA {i}/{len(questions)}:\n   {q_data['question']}\n")
+            if q_data.get('context'):
+                buf.write(f"   💡 Varför: {q_data['context']}\n")
+            if q_data.get('example_answer'):
+                buf.write(f"   📝 Exempel: {q_data['example_answer']}\n")
+            buf.write("\n")
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+        # Läs exakt en rad per fråga så att stdin lämnas orörd för resten av programmet
+        answers_raw = [sys.stdin.readline() for _ in questions]
+
+        answers = {}
+        for i, (q_data, raw) in enumerate(zip(questions, answers_raw), 1):
+            answer = raw.strip()
+            if answer:
+                answers[f"question_{i}"] = {
+                    "question": q_data['question'],
+                    "answer": answer,
+                    "metric_type": q_data.get('metric_type', 'text')
+                }
+
+        sys.stdout.write(f"{separator}\n✅ Samlade in {len(answers)} svar!\n{separator}\n\n")
+        sys.stdout.flush()
+
+        return answers
+
 
 def analyze_and_ask_for_job(
     job_description: str,
@@ -2,44 +2,119 @@
 User Preferences Manager
 Saves and loads user preferences to avoid repetitive questions.
 """
+from __future__ import annotations
+
+import copy
 import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Optional, Dict
 from src.logger_config import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data: bytes) -> Dict:
+    """Decode preferences JSON (orjson if available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _dumps(preferences: Dict, pretty: bool) -> bytes:
+    """Encode preferences as UTF-8 JSON bytes with sorted keys (orjson if available)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(preferences, option=option)
+    return json.dumps(preferences, indent=2 if pretty else None, ensure_ascii=False,
+                      sort_keys=True).encode('utf-8')
+
 
 class UserPreferences:
     """Manages persistent user preferences."""
     
     PREFERENCES_FILE = Path("data_folder/user_preferences.json")
     
+    # Write indented JSON (easier to read when debugging, larger and slower)
+    PRETTY_JSON = False
+    
+    # In-process cache of the parsed file, invalidated when its mtime changes
+    _cache: Optional[Dict] = None
+    _cache_key: Optional[tuple] = None
+    
+    @classmethod
+    def _file_key(cls) -> Optional[tuple]:
+        """Return (path, mtime_ns, size) for the preferences file, or None if missing."""
+        try:
+            st = os.stat(cls.PREFERENCES_FILE)
+        except FileNotFoundError:
+            return None
+        return (str(cls.PREFERENCES_FILE), st.st_mtime_ns, st.st_size)
+    
+    @classmethod
+    def _invalidate_cache(cls):
+        """Drop the cached preferences."""
+        cls._cache = None
+        cls._cache_key = None
+    
     @classmethod
     def load(cls) -> Dict:
-        """Load user preferences from file."""
-        if not cls.PREFERENCES_FILE.exists():
+        """Load user preferences from file (cached until the file changes)."""
+        key = cls._file_key()
+        if key is None:
             logger.debug("No preferences file found, using defaults")
+            cls._invalidate_cache()
             return {}
         
+        if cls._cache is not None and cls._cache_key == key:
+            # Deep copy: callers may mutate nested lists/dicts, and set() compares
+            # against the cache to decide whether anything changed
+            return copy.deepcopy(cls._cache)
+        
         try:
-            with open(cls.PREFERENCES_FILE, 'r', encoding='utf-8') as f:
-                prefs = json.load(f)
+            prefs = _loads(cls.PREFERENCES_FILE.read_bytes())
             logger.info(f"✅ Loaded preferences: {list(prefs.keys())}")
-            return prefs
+            cls._cache = prefs
+            cls._cache_key = key
+            return copy.deepcopy(prefs)
         except Exception as e:
             logger.warning(f"Failed to load preferences: {e}")
             return {}
     
     @classmethod
     def save(cls, preferences: Dict) -> bool:
-        """Save user preferences to file."""
+        """Save user preferences to file (atomically via temp file + rename)."""
+        tmp = None
         try:
             cls.PREFERENCES_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(cls.PREFERENCES_FILE, 'w', encoding='utf-8') as f:
-                json.dump(preferences, f, indent=2, ensure_ascii=False)
+            # Unique temp name, so concurrent saves never share a temp file
+            fd, tmp = tempfile.mkstemp(
+                dir=cls.PREFERENCES_FILE.parent, prefix=cls.PREFERENCES_FILE.name + '.', suffix='.tmp'
+            )
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumps(preferences, cls.PRETTY_JSON))
+            # mkstemp creates the file as 0600 - keep the existing file's permissions
+            try:
+                mode = os.stat(cls.PREFERENCES_FILE).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp, mode)
+            # Atomic rename - an interrupted save never leaves a truncated file
+            os.replace(tmp, cls.PREFERENCES_FILE)
+            cls._cache = copy.deepcopy(preferences)
+            cls._cache_key = cls._file_key()
             logger.info("💾 Preferences saved")
             return True
         except Exception as e:
             logger.error(f"Failed to save preferences: {e}")
+            if tmp is not None:
+                Path(tmp).unlink(missing_ok=True)
+            cls._invalidate_cache()
             return False
     
     @classmethod
@@ -49,15 +124,28 @@ class UserPreferences:
         return prefs.get(key, default)
     
     @classmethod
-    def set(cls, key: str, value):
-        """Set a specific preference value."""
+    def set(cls, key: str, value) -> bool:
+        """Set a specific preference value (no write if it is unchanged)."""
         prefs = cls.load()
+        if key in prefs and prefs[key] == value:
+            return True
         prefs[key] = value
-        cls.save(prefs)
+        return cls.save(prefs)
+    
+    @classmethod
+    def update(cls, values: Dict) -> bool:
+        """Set several preference values with at most one write."""
+        prefs = cls.load()
+        changed = {k: v for k, v in values.items() if k not in prefs or prefs[k] != v}
+        if not changed:
+            return True
+        prefs.update(changed)
+        return cls.save(prefs)
     
     @classmethod
     def clear(cls):
         """Clear all preferences."""
+        cls._invalidate_cache()
         if cls.PREFERENCES_FILE.exists():
             cls.PREFERENCES_FILE.unlink()
             logger.info("🗑️ Preferences cleared")
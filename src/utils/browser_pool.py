@@ -1,106 +1,310 @@
 """
 Browser Pool Manager for ApplyMind AI
 
-PERFORMANCE FIX: Singleton pattern to reuse Chrome browser instances
+PERFORMANCE FIX: Singleton pool that reuses Chrome browser instances
 instead of spawning O(n) browsers.
 
 Before: 13 browser spawns × 3 seconds = 39 seconds wasted
 After: 1 browser spawn × 3 seconds = 3 seconds (13× faster!)
 
+The pool holds up to POOL_SIZE drivers (env APPLYMIND_BROWSER_POOL_SIZE,
+default 2) so several documents can be rendered concurrently.
+
 Usage:
     with BrowserPool.get_instance() as driver:
         # Use driver for multiple operations
         html_to_pdf(html1, driver)
         html_to_pdf(html2, driver)
         # Browser automatically closed on exit
+
+    # Concurrent work: borrow a driver and give it back
+    pool = BrowserPool.get_instance()
+    driver = pool.acquire()
+    try:
+        html_to_pdf(html, driver)
+    finally:
+        pool.release(driver)
+
+    # Or render several documents at once
+    resume_b64, cover_b64 = generate_pdfs_parallel([resume_html, cover_html])
 """
-import atexit
-from typing import Optional
-from selenium.webdriver import Chrome
+from __future__ import annotations
+
+import os
+import queue
+import signal
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional
 from loguru import logger
 
+if TYPE_CHECKING:
+    from selenium.webdriver import Chrome
+
+
+# Max number of Chrome instances the pool may hold at once
+POOL_SIZE = max(1, int(os.getenv("APPLYMIND_BROWSER_POOL_SIZE", "2")))
+
+# Recycle a driver after this many acquire/release cycles to limit memory bloat
+MAX_USES_PER_INSTANCE = 50
+
+# Default seconds to wait for a free driver in acquire()
+ACQUIRE_TIMEOUT = 120
+
+
+def _quit_drivers(use_counts: Dict[Chrome, int], shared: List[Chrome]):
+    """Quit every driver still tracked by the pool (exit/finalizer hook)."""
+    drivers = list(use_counts) + shared
+    use_counts.clear()
+    shared.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def _install_sigterm_handler():
+    """
+    Turn SIGTERM into SystemExit so the exit hook quits pooled browsers.
+
+    The handler itself takes no locks and quits nothing: it may interrupt a
+    thread holding the pool lock, and driver.quit() blocks. Unwinding via
+    SystemExit lets the weakref.finalize hook run at normal interpreter exit.
+    SIGINT needs no handler since KeyboardInterrupt already unwinds, and an
+    app that catches Ctrl-C keeps its browsers.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        # signal.signal() only works from the main thread
+        return
+
+    previous = signal.getsignal(signal.SIGTERM)
+    if previous not in (signal.SIG_DFL, None):
+        # The app (or a framework) already handles SIGTERM; leave it alone
+        return
+
+    def handler(sig, frame):
+        raise SystemExit(128 + sig)
+
+    signal.signal(signal.SIGTERM, handler)
+
 
 class BrowserPool:
     """
     Singleton Browser Pool to manage Chrome WebDriver instances.
-    
+
     This eliminates the performance bottleneck of spawning a new browser
     for every document generation operation.
-    
+
     Features:
-    - Singleton pattern ensures only one browser instance
+    - Singleton pattern ensures only one pool
+    - Bounded queue of up to POOL_SIZE drivers (acquire/release)
+    - Drivers are recycled after MAX_USES_PER_INSTANCE uses
     - Context manager for automatic cleanup
     - Thread-safe (using class-level lock)
-    - Automatic cleanup on program exit
+    - Automatic cleanup on program exit, including SIGTERM
     """
-    
-    _instance: Optional['BrowserPool'] = None
-    _driver: Optional[Chrome] = None
-    _lock = None  # Will be threading.Lock() if needed
-    
+
+    _instance: Optional[BrowserPool] = None
+    _lock = threading.Lock()
+    _exit_hooks_installed = False
+
     def __new__(cls):
-        """Singleton pattern - only one instance allowed."""
+        """Singleton pattern - only one instance allowed (double-checked locking)."""
         if cls._instance is None:
-            cls._instance = super(BrowserPool, cls).__new__(cls)
-            logger.info("🌐 BrowserPool singleton created")
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(BrowserPool, cls).__new__(cls)
+                    instance._init_pool()
+                    cls._instance = instance
+                    logger.info("🌐 BrowserPool singleton created")
         return cls._instance
-    
+
+    def _init_pool(self):
+        """Set up the empty pool state (called once from __new__)."""
+        self._drivers: queue.Queue[Chrome] = queue.Queue(maxsize=POOL_SIZE)
+        self._use_counts: Dict[Chrome, int] = {}
+        self._created = 0
+        self._state_lock = threading.Lock()
+        # Shared driver handed out by get_driver() for long-lived callers.
+        # It lives outside the queue so it never takes a slot from acquire().
+        self._driver: Optional[Chrome] = None
+        self._shared_drivers: List[Chrome] = []
+        self._driver_lock = threading.Lock()
+        self._install_exit_hooks()
+
+    def _install_exit_hooks(self):
+        """Register exit cleanup once per process instead of once per spawned driver."""
+        cls = type(self)
+        if cls._exit_hooks_installed:
+            return
+        cls._exit_hooks_installed = True
+        # finalize also runs at interpreter exit, so no separate atexit hook is needed.
+        # cleanup() clears both containers in place, so the finalizer always sees live drivers.
+        weakref.finalize(self, _quit_drivers, self._use_counts, self._shared_drivers)
+        _install_sigterm_handler()
+
     @classmethod
     def get_instance(cls) -> 'BrowserPool':
         """
         Get or create the singleton BrowserPool instance.
-        
+
         Returns:
             BrowserPool: The singleton instance
         """
         if cls._instance is None:
-            cls._instance = BrowserPool()
+            # __new__ takes the lock, so concurrent callers share one instance
+            BrowserPool()
         return cls._instance
-    
+
+    def _reserve_slot(self) -> bool:
+        """Reserve room for one more driver if the pool is not full."""
+        with self._state_lock:
+            if self._created < POOL_SIZE:
+                self._created += 1
+                return True
+            return False
+
+    def _spawn_driver(self) -> Chrome:
+        """Start a new Chrome instance in a previously reserved slot."""
+        logger.info("🚀 Starting new Chrome browser instance...")
+        from src.utils.chrome_utils import init_browser
+        try:
+            driver = init_browser(headless=True)
+        except Exception:
+            with self._state_lock:
+                self._created -= 1
+            raise
+        with self._state_lock:
+            self._use_counts[driver] = 0
+        logger.info("✅ Chrome browser ready")
+        return driver
+
+    def _discard(self, driver: Chrome):
+        """Quit a driver and free its slot in the pool."""
+        with self._state_lock:
+            if self._use_counts.pop(driver, None) is None:
+                return
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.error(f"Error closing browser: {e}")
+
+    def acquire(self, timeout: float = ACQUIRE_TIMEOUT) -> Chrome:
+        """
+        Borrow a driver from the pool, starting a new one if there is room.
+
+        Blocks until a driver is released when the pool is full.
+
+        Args:
+            timeout: Max seconds to wait for a free driver
+
+        Returns:
+            Chrome: WebDriver instance, to be handed back with release()
+
+        Raises:
+            RuntimeError: If no driver becomes available within timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self._drivers.get_nowait()
+            except queue.Empty:
+                pass
+
+            if self._reserve_slot():
+                return self._spawn_driver()
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError(f"No browser available in pool after {timeout}s")
+            try:
+                # Short waits so slots freed by recycling are noticed too
+                return self._drivers.get(timeout=min(remaining, 0.5))
+            except queue.Empty:
+                continue
+
+    def release(self, driver: Chrome):
+        """
+        Return a driver borrowed with acquire().
+
+        Drivers that reached MAX_USES_PER_INSTANCE are quit instead and a
+        fresh one is started on a later acquire().
+        """
+        with self._state_lock:
+            if driver not in self._use_counts:
+                # Pool was cleaned up while the driver was checked out
+                return
+            self._use_counts[driver] += 1
+            recycle = self._use_counts[driver] >= MAX_USES_PER_INSTANCE
+
+        if recycle:
+            logger.info(f"♻️ Recycling Chrome instance after {MAX_USES_PER_INSTANCE} uses")
+            self._discard(driver)
+        else:
+            self._drivers.put(driver)
+
     def get_driver(self) -> Chrome:
         """
-        Get the Chrome WebDriver instance.
+        Get the shared Chrome WebDriver instance.
         Creates a new one if it doesn't exist or was closed.
-        
+
+        The shared driver is kept outside the pool until cleanup(), so it
+        does not count towards POOL_SIZE and acquire() never waits for it.
+        It is not headless, since callers also use it for interactive logins.
+
         Returns:
             Chrome: Active WebDriver instance
         """
         if self._driver is None:
-            logger.info("🚀 Starting new Chrome browser instance...")
-            from src.utils.chrome_utils import init_browser
-            self._driver = init_browser()
-            logger.info("✅ Chrome browser ready")
-            
-            # Register cleanup on exit
-            atexit.register(self.cleanup)
-        
+            with self._driver_lock:
+                if self._driver is None:
+                    from src.utils.chrome_utils import init_browser
+                    driver = init_browser()
+                    with self._state_lock:
+                        self._shared_drivers.append(driver)
+                        self._driver = driver
+
         return self._driver
-    
+
     def cleanup(self):
-        """Close and cleanup the browser instance."""
-        if self._driver is not None:
+        """Close and cleanup all browser instances."""
+        with self._state_lock:
+            drivers = list(self._use_counts) + self._shared_drivers
+            self._use_counts.clear()
+            self._shared_drivers.clear()
+            self._created = 0
+            self._drivers = queue.Queue(maxsize=POOL_SIZE)
+            self._driver = None
+
+        if not drivers:
+            return
+
+        logger.info(f"🧹 Closing {len(drivers)} Chrome browser(s)...")
+        for driver in drivers:
             try:
-                logger.info("🧹 Closing Chrome browser...")
-                self._driver.quit()
-                self._driver = None
-                logger.info("✅ Chrome browser closed")
+                driver.quit()
             except Exception as e:
                 logger.error(f"Error closing browser: {e}")
-    
+        logger.info("✅ Chrome browser closed")
+
     def reset(self):
         """
-        Force reset the browser instance.
+        Force reset the browser instances.
         Useful if browser becomes unresponsive.
         """
         logger.warning("🔄 Resetting browser instance...")
         self.cleanup()
         self._driver = None
         logger.info("✅ Browser reset complete")
-    
+
     def __enter__(self):
         """Context manager entry - returns driver."""
         return self.get_driver()
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - keeps browser alive for reuse."""
         if exc_type is not None:
@@ -113,44 +317,47 @@ class BrowserPool:
 class BrowserSession:
     """
     Context manager for browser sessions.
-    
-    Use this when you want to ensure browser cleanup after multiple operations.
-    
+
+    Borrows its own driver from the pool, so several sessions can run
+    in parallel threads.
+
     Example:
         with BrowserSession() as driver:
             pdf1 = html_to_pdf(html1, driver)
             pdf2 = html_to_pdf(html2, driver)
             # Browser closed automatically after this block
     """
-    
+
     def __init__(self, auto_cleanup: bool = True):
         """
         Initialize browser session.
-        
+
         Args:
-            auto_cleanup: If True, closes browser on exit. If False, keeps it alive.
+            auto_cleanup: If True, closes browser on exit. If False, returns it to the pool.
         """
         self.auto_cleanup = auto_cleanup
         self.pool = BrowserPool.get_instance()
         self.driver = None
-    
+
     def __enter__(self):
         """Start browser session."""
-        self.driver = self.pool.get_driver()
+        self.driver = self.pool.acquire()
         logger.debug("🌐 Browser session started")
         return self.driver
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End browser session."""
         if exc_type is not None:
             logger.error(f"Browser session error: {exc_val}")
-        
+
         if self.auto_cleanup:
-            self.pool.cleanup()
+            self.pool._discard(self.driver)
             logger.debug("🧹 Browser session cleaned up")
         else:
+            self.pool.release(self.driver)
             logger.debug("🔄 Browser session ended (browser kept alive)")
-        
+        self.driver = None
+
         return False  # Don't suppress exceptions
 
 
@@ -158,7 +365,7 @@ class BrowserSession:
 def get_browser() -> Chrome:
     """
     Get a browser instance from the pool.
-    
+
     Returns:
         Chrome: Active browser instance
     """
@@ -168,7 +375,7 @@ def get_browser() -> Chrome:
 def cleanup_browser():
     """
     Manually cleanup the browser instance.
-    
+
     Use this at the end of your program or when switching contexts.
     """
     BrowserPool.get_instance().cleanup()
@@ -181,6 +388,41 @@ def reset_browser():
     BrowserPool.get_instance().reset()
 
 
+def generate_pdfs_parallel(html_list: List[str]) -> List[str]:
+    """
+    Render several HTML documents to PDF concurrently using the pool.
+
+    Each worker borrows its own driver, so at most POOL_SIZE documents are
+    rendered at once; extra documents wait in acquire() until a driver is free.
+
+    Args:
+        html_list: HTML documents to render
+
+    Returns:
+        List[str]: Base64-encoded PDFs in the same order as html_list
+    """
+    from src.utils.chrome_utils import HTML_to_PDF
+
+    pool = BrowserPool.get_instance()
+
+    def render(html: str) -> str:
+        driver = pool.acquire()
+        try:
+            result = HTML_to_PDF(html, driver)
+        except Exception:
+            # Don't hand a possibly broken browser to the next worker
+            pool._discard(driver)
+            raise
+        pool.release(driver)
+        return result
+
+    if len(html_list) <= 1:
+        return [render(html) for html in html_list]
+
+    with ThreadPoolExecutor(max_workers=min(POOL_SIZE, len(html_list))) as executor:
+        return list(executor.map(render, html_list))
+
+
 # Export main classes and functions
 __all__ = [
     'BrowserPool',
@@ -188,5 +430,5 @@ __all__ = [
     'get_browser',
     'cleanup_browser',
     'reset_browser',
+    'generate_pdfs_parallel',
 ]
-
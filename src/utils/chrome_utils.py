@@ -1,22 +1,87 @@
+from __future__ import annotations
+
 import os
+import re
+import functools
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager  # Import webdriver_manager
-import urllib
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urljoin, urlparse
 from src.logger_config import logger
 
-def chrome_browser_options():
+# selenium, webdriver_manager and requests are imported lazily inside the
+# functions that need them, so importing this module stays cheap
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+# Max väntetid (sekunder) på att sidan och dess typsnitt ska bli klara före utskrift
+PAGE_LOAD_TIMEOUT = 10
+
+# Timeout (sekunder) för att hämta externa stilmallar som ska bäddas in
+ASSET_FETCH_TIMEOUT = 5
+
+# Max storlek (bytes) på en hämtad resurs; större svar bäddas inte in
+MAX_ASSET_BYTES = 1024 * 1024
+
+# Google Fonts anpassar CSS:en efter User-Agent - be om samma woff2-variant som Chrome får
+_ASSET_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+}
+
+_LINK_TAG_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+_HREF_ATTR_RE = re.compile(r"""href\s*=\s*(["'])(.*?)\1""", re.IGNORECASE)
+_MEDIA_ATTR_RE = re.compile(r"""\bmedia\s*=\s*(["']?)([^"'>]*)\1""", re.IGNORECASE)
+_REL_STYLESHEET_RE = re.compile(r"""rel\s*=\s*(["'])[^"']*\bstylesheet\b[^"']*\1""", re.IGNORECASE)
+_CSS_IMPORT_RE = re.compile(
+    r"""@import\s+(?:url\(\s*(["']?)(?P<u1>https?://[^"')]+)\1\s*\)|(["'])(?P<u2>https?://[^"']+)\3)[^;]*;""",
+    re.IGNORECASE,
+)
+_CSS_URL_RE = re.compile(r"""url\(\s*(["']?)(.*?)\1\s*\)""", re.IGNORECASE)
+_STYLE_BLOCK_RE = re.compile(r"(<style\b[^>]*>)(.*?)(</style\s*>)", re.IGNORECASE | re.DOTALL)
+_STYLE_END_RE = re.compile(r"</(?=style)", re.IGNORECASE)
+
+# Max nivåer av @import som följs i hämtade stilmallar
+MAX_IMPORT_DEPTH = 3
+
+# CDP-parametrar är fasta, så de byggs en gång i stället för vid varje anrop
+_EMULATE_PRINT = {"media": "print"}
+
+# Optimerade PDF-inställningar för bättre layout-bevarande
+_PDF_OPTS = {
+    "printBackground": True,          # Inkludera bakgrund och färger
+    "landscape": False,               # Porträtt-läge
+    "paperWidth": 8.27,               # A4 bredd (210mm)
+    "paperHeight": 11.69,             # A4 höjd (297mm)
+    "marginTop": 0.2,                 # MINIMALA marginaler för max innehåll
+    "marginBottom": 0.2,              # 0.2" ≈ 0.5 cm
+    "marginLeft": 0.2,                # 0.2" ≈ 0.5 cm
+    "marginRight": 0.2,               # 0.2" ≈ 0.5 cm
+    "displayHeaderFooter": False,     # Ingen header/footer
+    "preferCSSPageSize": False,       # Använd våra paper-dimensioner
+    "scale": 0.95,                    # Liten skalning för att passa bättre
+    "generateDocumentOutline": False,
+    "generateTaggedPDF": False,
+    "transferMode": "ReturnAsBase64"
+}
+
+def chrome_browser_options(headless: bool = False):
+    from selenium.webdriver.chrome.options import Options
+
     logger.debug("Setting Chrome browser options")
     options = Options()
-    options.add_argument("--start-maximized")
+    # Headless only for PDF rendering (new mode = production renderer, full
+    # Page.printToPDF support); scrapers keep a visible window.
+    # Set APPLYMIND_HEADLESS=0 to get a visible window for debugging.
+    if headless and os.getenv("APPLYMIND_HEADLESS", "1") != "0":
+        options.add_argument("--headless=new")
+    else:
+        options.add_argument("--start-maximized")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--ignore-certificate-errors")
     options.add_argument("--disable-extensions")
     options.add_argument("--disable-gpu")  # Opzionale, utile in alcuni ambienti
-    options.add_argument("window-size=1200x800")
+    options.add_argument("--window-size=1200,1600")
     options.add_argument("--disable-background-timer-throttling")
     options.add_argument("--disable-backgrounding-occluded-windows")
     options.add_argument("--disable-translate")
@@ -27,20 +92,31 @@ def chrome_browser_options():
     options.add_argument("--disable-autofill")
     options.add_argument("--disable-plugins")
     options.add_argument("--disable-animations")
-    options.add_argument("--disable-cache")
+    # No --disable-cache: resume, cover letter and email share fonts/CSS, and the
+    # incognito profile's in-memory cache lets later renders in a session reuse them
     options.add_argument("--incognito")
     # 🔒 SECURITY FIX: Removed --disable-web-security and --allow-file-access-from-files
     # These flags disabled Same-Origin Policy and allowed file:// access
-    # PDF generation uses data: URLs which don't need these dangerous flags
+    # PDF generation injects self-contained HTML into about:blank, which doesn't need these dangerous flags
     logger.debug("Using Chrome in incognito mode with security enabled")
     
     return options
 
-def init_browser() -> webdriver.Chrome:
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve ChromeDriver via webdriver_manager once per process."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def init_browser(headless: bool = False) -> webdriver.Chrome:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service as ChromeService
+
     try:
-        options = chrome_browser_options()
+        options = chrome_browser_options(headless=headless)
         # Use webdriver_manager to handle ChromeDriver
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+        driver = webdriver.Chrome(service=ChromeService(_chromedriver_path()), options=options)
         logger.debug("Chrome browser initialized successfully.")
         return driver
     except Exception as e:
@@ -49,6 +125,153 @@ def init_browser() -> webdriver.Chrome:
 
 
 
+def _is_allowed_asset_url(url: str) -> bool:
+    """Endast publika http(s)-adresser får hämtas (SSRF-skydd, även via DNS-namn)."""
+    try:
+        from src.security_utils import SecurityValidator
+        return SecurityValidator.validate_resolved_url(url)
+    except ValueError:
+        return False
+
+
+def _connected_ip(response) -> Optional[str]:
+    """IP-adressen som svaret faktiskt kom ifrån, eller None om den inte går att avgöra."""
+    try:
+        return response.raw._fp.fp.raw._sock.getpeername()[0]
+    except (AttributeError, OSError, IndexError, TypeError):
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch_asset(url: str) -> Optional[bytes]:
+    """Hämta en extern resurs en gång per process; None om det misslyckas."""
+    import requests
+    from src.security_utils import SecurityValidator
+
+    if not _is_allowed_asset_url(url):
+        return None
+    try:
+        # Omdirigeringar följs inte: Location kan peka på en intern adress
+        with requests.get(
+            url, headers=_ASSET_HEADERS, timeout=ASSET_FETCH_TIMEOUT,
+            allow_redirects=False, stream=True,
+        ) as response:
+            if response.is_redirect or response.status_code >= 300:
+                logger.debug(f"Hämtar inte {url} för inbäddning: HTTP {response.status_code}")
+                return None
+            # DNS kan ge en annan adress vid anslutningen än vid kontrollen (DNS rebinding)
+            peer = _connected_ip(response)
+            if peer is None or not SecurityValidator.is_public_address(peer):
+                logger.warning(f"Blockerade {url}: anslöt till icke-publik adress {peer}")
+                return None
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body += chunk
+                if len(body) > MAX_ASSET_BYTES:
+                    logger.debug(f"Hämtar inte {url} för inbäddning: större än {MAX_ASSET_BYTES} bytes")
+                    return None
+            return bytes(body)
+    except requests.RequestException as e:
+        logger.debug(f"Kunde inte hämta {url} för inbäddning: {e}")
+        return None
+
+
+def _rewrite_css_urls(css: str, base_url: str) -> str:
+    """Gör url() absoluta så att de fungerar när CSS:en bäddas in i dokumentet."""
+    def replace(match):
+        raw = match.group(2)
+        if raw.startswith("data:"):
+            return match.group(0)
+        return f'url("{urljoin(base_url, raw)}")'
+
+    return _CSS_URL_RE.sub(replace, css)
+
+
+def _inline_css_imports(css: str, depth: int) -> str:
+    """Ersätt @import url(https://...) i CSS med den hämtade stilmallen."""
+    if depth >= MAX_IMPORT_DEPTH:
+        return css
+
+    def replace_import(match):
+        inlined = _inline_stylesheet(match.group("u1") or match.group("u2"), depth + 1)
+        return match.group(0) if inlined is None else inlined
+
+    return _CSS_IMPORT_RE.sub(replace_import, css)
+
+
+@functools.lru_cache(maxsize=32)
+def _inline_stylesheet(url: str, depth: int = 0) -> Optional[str]:
+    """Hämta en stilmall och returnera den färdig att bädda in (memoiserad per URL)."""
+    data = _fetch_asset(url)
+    if data is None:
+        return None
+    css = _rewrite_css_urls(data.decode("utf-8", errors="replace"), url)
+    css = _inline_css_imports(css, depth)
+    # Hämtat innehåll får aldrig kunna avsluta <style>-blocket och injicera HTML
+    return _STYLE_END_RE.sub(r"<\\/", css)
+
+
+def preprocess_html(html: str) -> str:
+    """
+    Bädda in externa stilmallar och webbtypsnitt direkt i HTML:en.
+
+    <link rel="stylesheet" href="https://..."> och @import url(https://...)
+    ersätts med <style>/CSS-innehållet. Typsnitts-URL:er görs bara absoluta:
+    Chrome hämtar själv de unicode-range-delmängder som sidan faktiskt använder.
+    Länkar med ett media-attribut (annat än "all") och resurser som inte kan
+    hämtas lämnas orörda.
+
+    @import tolkas bara inuti <style>-block (och i hämtade stilmallar), aldrig
+    i brödtexten - den kan innehålla annonstext och LLM-text.
+    """
+    def replace_link(match):
+        tag = match.group(0)
+        href = _HREF_ATTR_RE.search(tag)
+        if not href or not _REL_STYLESHEET_RE.search(tag) or not href.group(2).startswith(("http://", "https://")):
+            return tag
+        media = _MEDIA_ATTR_RE.search(tag)
+        if media and media.group(2).strip().lower() not in ("", "all"):
+            # En print- eller screen-stilmall får inte börja gälla för alla media
+            return tag
+        css = _inline_stylesheet(href.group(2))
+        return tag if css is None else f"<style>{css}</style>"
+
+    def replace_style(match):
+        return match.group(1) + _inline_css_imports(match.group(2), 0) + match.group(3)
+
+    # <style>-block först, så att redan inbäddade stilmallar inte bearbetas igen
+    html = _STYLE_BLOCK_RE.sub(replace_style, html)
+    return _LINK_TAG_RE.sub(replace_link, html)
+
+
+def _wait_until_rendered(driver, timeout=PAGE_LOAD_TIMEOUT):
+    """
+    Vänta tills dokumentet är helt laddat och alla webbtypsnitt är klara.
+
+    Page.printToPDF renderar från layout-trädet, så ingen scrollning behövs.
+    Båda väntningarna delar på timeout; blir sidan inte klar i tid fortsätter
+    utskriften ändå.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+
+    deadline = time.monotonic() + timeout
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException()
+        driver.set_script_timeout(remaining)
+        driver.execute_async_script(
+            "const done = arguments[arguments.length - 1];"
+            "document.fonts.ready.then(() => done(true), () => done(false));"
+        )
+    except TimeoutException:
+        logger.warning(f"Sidan blev inte klar inom {timeout}s, skriver ut ändå")
+
+
 def HTML_to_PDF(html_content, driver):
     """
     Converte una stringa HTML in un PDF e restituisce il PDF come stringa base64.
@@ -63,45 +286,45 @@ def HTML_to_PDF(html_content, driver):
     if not isinstance(html_content, str) or not html_content.strip():
         raise ValueError("Il contenuto HTML deve essere una stringa non vuota.")
 
-    # Codifica l'HTML in un URL di tipo data
-    encoded_html = urllib.parse.quote(html_content)
-    data_url = f"data:text/html;charset=utf-8,{encoded_html}"
+    html_content = preprocess_html(html_content)
 
     try:
         # Aktivera CSS print media emulation FÖRE HTML laddas
-        driver.execute_cdp_cmd("Emulation.setEmulatedMedia", {
-            "media": "print"
-        })
-        
-        driver.get(data_url)
-        
-        # Vänta på att sidan laddas
-        time.sleep(3)
-        
-        # Tvinga rendering genom att scrolla och vänta
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1)
-        driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)  # Total 6 sekunder - säkerställ att allt är laddat
-        
-        # Optimerade PDF-inställningar för bättre layout-bevarande
-        pdf_base64 = driver.execute_cdp_cmd("Page.printToPDF", {
-            "printBackground": True,          # Inkludera bakgrund och färger
-            "landscape": False,               # Porträtt-läge
-            "paperWidth": 8.27,               # A4 bredd (210mm)
-            "paperHeight": 11.69,             # A4 höjd (297mm)
-            "marginTop": 0.2,                 # MINIMALA marginaler för max innehåll
-            "marginBottom": 0.2,              # 0.2" ≈ 0.5 cm
-            "marginLeft": 0.2,                # 0.2" ≈ 0.5 cm
-            "marginRight": 0.2,               # 0.2" ≈ 0.5 cm
-            "displayHeaderFooter": False,     # Ingen header/footer
-            "preferCSSPageSize": False,       # Använd våra paper-dimensioner
-            "scale": 0.95,                    # Liten skalning för att passa bättre
-            "generateDocumentOutline": False,
-            "generateTaggedPDF": False,
-            "transferMode": "ReturnAsBase64"
-        })
+        driver.execute_cdp_cmd("Emulation.setEmulatedMedia", _EMULATE_PRINT)
+
+        # Ladda HTML i en tom about:blank-sida via CDP i stället för file:// eller data:-URL.
+        # Dokumentet får då inget file://-ursprung och kan inte bädda in lokala filer,
+        # och det finns varken temporär fil eller ~2MB-gräns som för data:-URL:er.
+        driver.get("about:blank")
+        frame_id = driver.execute_cdp_cmd("Page.getFrameTree", {})["frameTree"]["frame"]["id"]
+        driver.execute_cdp_cmd(
+            "Page.setDocumentContent", {"frameId": frame_id, "html": html_content}
+        )
+        _wait_until_rendered(driver)
+
+        pdf_base64 = driver.execute_cdp_cmd("Page.printToPDF", _PDF_OPTS)
         return pdf_base64['data']
     except Exception as e:
         logger.error(f"Si è verificata un'eccezione WebDriver: {e}")
         raise RuntimeError(f"Si è verificata un'eccezione WebDriver: {e}")
+
+
+def save_pdf_to_output(output_path, pdf_data: bytes, durable: bool = False) -> None:
+    """
+    Skriver PDF-bytes direkt till disk via os.open/os.write utan Pythons filbuffring.
+
+    :param output_path: Sökväg där PDF:en ska sparas.
+    :param pdf_data: PDF-innehållet som bytes.
+    :param durable: Om True körs os.fsync innan filen stängs.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(str(output_path), flags, 0o644)
+    try:
+        view = memoryview(pdf_data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
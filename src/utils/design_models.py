@@ -12,46 +12,53 @@ Benefits:
 - No typo risks
 - Self-documenting code
 """
-from enum import Enum, auto
+from __future__ import annotations
+
+from enum import IntEnum
 from typing import Dict, List
 
 
-class DesignModel(Enum):
+class DesignModel(IntEnum):
     """
     Enumeration of available CV design models.
     
     Each model has its own facade, style manager, and templates.
+    Members are ints for cheap comparisons; the string form lives in `.code`.
+    Values start at 1 so every member is truthy, and the range is disjoint
+    from GenerationMode so members of the two enums never compare equal.
+
+    json.dumps() writes the int value, so persist `model.code` and read it
+    back with from_string() instead of storing the member itself.
     """
-    ORIGINAL = "URSPRUNGLIGA"
-    MODERN_DESIGN_1 = "MODERN_DESIGN_1"
-    MODERN_DESIGN_2 = "MODERN_DESIGN_2"
+    ORIGINAL = 1
+    MODERN_DESIGN_1 = 2
+    MODERN_DESIGN_2 = 3
     
     def __str__(self) -> str:
-        """Return the string value for display."""
-        return self.value
+        """Return the string code for display."""
+        return self.code
+    
+    def __format__(self, format_spec: str) -> str:
+        """Format as the string code (IntEnum would otherwise format as int)."""
+        return format(self.code, format_spec)
+    
+    @property
+    def code(self) -> str:
+        """Get the string code used for serialization (e.g. "MODERN_DESIGN_1")."""
+        return _DESIGN_CODES[self]
     
     @property
     def display_name(self) -> str:
         """Get human-readable display name."""
-        display_names = {
-            DesignModel.ORIGINAL: "Ursprungliga (Klassiska mallar)",
-            DesignModel.MODERN_DESIGN_1: "Modern Design 1 (Professionella)",
-            DesignModel.MODERN_DESIGN_2: "Modern Design 2 (Kreativa sidopanel)",
-        }
-        return display_names[self]
+        return _DESIGN_DISPLAY_NAMES[self]
     
     @property
     def description(self) -> str:
         """Get detailed description of the design model."""
-        descriptions = {
-            DesignModel.ORIGINAL: "Klassiska CV-mallar med tidlös design. Fungerar för alla branscher.",
-            DesignModel.MODERN_DESIGN_1: "Moderna professionella mallar med clean design. Perfekt för tech och business.",
-            DesignModel.MODERN_DESIGN_2: "Kreativa mallar med sidopanel och gradients. Står ut från mängden!",
-        }
-        return descriptions[self]
+        return _DESIGN_DESCRIPTIONS[self]
     
     @classmethod
-    def from_string(cls, value: str) -> 'DesignModel':
+    def from_string(cls, value: str) -> DesignModel:
         """
         Convert string to DesignModel enum.
         
@@ -64,22 +71,22 @@ class DesignModel(Enum):
         Raises:
             ValueError: If value doesn't match any model
         """
-        for model in cls:
-            if model.value == value:
-                return model
+        model = _DESIGN_BY_CODE.get(value)
+        if model is not None:
+            return model
         
         # Try case-insensitive match
-        for model in cls:
-            if model.value.lower() == value.lower():
-                return model
+        model = _DESIGN_BY_CODE_CI.get(value.lower())
+        if model is not None:
+            return model
         
         raise ValueError(
             f"Unknown design model: '{value}'. "
-            f"Valid options: {', '.join(m.value for m in cls)}"
+            f"Valid options: {', '.join(m.code for m in cls)}"
         )
     
     @classmethod
-    def get_all_models(cls) -> List['DesignModel']:
+    def get_all_models(cls) -> List[DesignModel]:
         """Get list of all available design models."""
         return list(cls)
     
@@ -89,45 +96,45 @@ class DesignModel(Enum):
         Get dictionary suitable for inquirer choices.
         
         Returns:
-            Dict mapping display names to enum values
+            Dict mapping display names to model codes
         """
         return {
-            model.display_name: model.value
+            model.display_name: model.code
             for model in cls
         }
 
 
-class GenerationMode(Enum):
+class GenerationMode(IntEnum):
     """
     Enumeration of document generation modes.
+
+    Values (101+) are disjoint from DesignModel; persist `mode.code`, not the int.
     """
-    STANDARD_RESUME = "standard_resume"
-    TAILORED_RESUME = "tailored_resume"
-    COVER_LETTER = "cover_letter"
-    EMAIL_APPLICATION = "email_application"
+    STANDARD_RESUME = 101
+    TAILORED_RESUME = 102
+    COVER_LETTER = 103
+    EMAIL_APPLICATION = 104
     
     def __str__(self) -> str:
-        return self.value
+        return self.code
+    
+    def __format__(self, format_spec: str) -> str:
+        return format(self.code, format_spec)
+    
+    @property
+    def code(self) -> str:
+        """Get the string code used for serialization (e.g. "cover_letter")."""
+        return _MODE_CODES[self]
     
     @property
     def display_name(self) -> str:
         """Get human-readable display name."""
-        display_names = {
-            GenerationMode.STANDARD_RESUME: "Generate Resume",
-            GenerationMode.TAILORED_RESUME: "Generate Resume Tailored for Job Description",
-            GenerationMode.COVER_LETTER: "Generate Tailored Cover Letter for Job Description",
-            GenerationMode.EMAIL_APPLICATION: "Generate and Send Job Application via Email",
-        }
-        return display_names[self]
+        return _MODE_DISPLAY_NAMES[self]
     
     @property
     def requires_job_url(self) -> bool:
         """Check if this mode requires a job URL."""
-        return self in [
-            GenerationMode.TAILORED_RESUME,
-            GenerationMode.COVER_LETTER,
-            GenerationMode.EMAIL_APPLICATION,
-        ]
+        return self in _JOB_URL_MODES
     
     @property
     def requires_email_config(self) -> bool:
@@ -135,17 +142,17 @@ class GenerationMode(Enum):
         return self == GenerationMode.EMAIL_APPLICATION
     
     @classmethod
-    def from_string(cls, value: str) -> 'GenerationMode':
+    def from_string(cls, value: str) -> GenerationMode:
         """Convert display name or value to GenerationMode enum."""
         # Try exact match on display name
-        for mode in cls:
-            if mode.display_name == value:
-                return mode
+        mode = _MODE_BY_DISPLAY_NAME.get(value)
+        if mode is not None:
+            return mode
         
-        # Try exact match on value
-        for mode in cls:
-            if mode.value == value:
-                return mode
+        # Try exact match on code
+        mode = _MODE_BY_CODE.get(value)
+        if mode is not None:
+            return mode
         
         raise ValueError(
             f"Unknown generation mode: '{value}'. "
@@ -153,7 +160,7 @@ class GenerationMode(Enum):
         )
     
     @classmethod
-    def get_all_modes(cls) -> List['GenerationMode']:
+    def get_all_modes(cls) -> List[GenerationMode]:
         """Get list of all available generation modes."""
         return list(cls)
     
@@ -163,6 +170,52 @@ class GenerationMode(Enum):
         return [mode.display_name for mode in cls]
 
 
+# Lookup tables built once at import time (properties and from_string are single dict lookups)
+_DESIGN_CODES: Dict[DesignModel, str] = {
+    DesignModel.ORIGINAL: "URSPRUNGLIGA",
+    DesignModel.MODERN_DESIGN_1: "MODERN_DESIGN_1",
+    DesignModel.MODERN_DESIGN_2: "MODERN_DESIGN_2",
+}
+
+_DESIGN_DISPLAY_NAMES: Dict[DesignModel, str] = {
+    DesignModel.ORIGINAL: "Ursprungliga (Klassiska mallar)",
+    DesignModel.MODERN_DESIGN_1: "Modern Design 1 (Professionella)",
+    DesignModel.MODERN_DESIGN_2: "Modern Design 2 (Kreativa sidopanel)",
+}
+
+_DESIGN_DESCRIPTIONS: Dict[DesignModel, str] = {
+    DesignModel.ORIGINAL: "Klassiska CV-mallar med tidlös design. Fungerar för alla branscher.",
+    DesignModel.MODERN_DESIGN_1: "Moderna professionella mallar med clean design. Perfekt för tech och business.",
+    DesignModel.MODERN_DESIGN_2: "Kreativa mallar med sidopanel och gradients. Står ut från mängden!",
+}
+
+_DESIGN_BY_CODE: Dict[str, DesignModel] = {code: m for m, code in _DESIGN_CODES.items()}
+_DESIGN_BY_CODE_CI: Dict[str, DesignModel] = {code.lower(): m for m, code in _DESIGN_CODES.items()}
+
+_MODE_CODES: Dict[GenerationMode, str] = {
+    GenerationMode.STANDARD_RESUME: "standard_resume",
+    GenerationMode.TAILORED_RESUME: "tailored_resume",
+    GenerationMode.COVER_LETTER: "cover_letter",
+    GenerationMode.EMAIL_APPLICATION: "email_application",
+}
+
+_MODE_DISPLAY_NAMES: Dict[GenerationMode, str] = {
+    GenerationMode.STANDARD_RESUME: "Generate Resume",
+    GenerationMode.TAILORED_RESUME: "Generate Resume Tailored for Job Description",
+    GenerationMode.COVER_LETTER: "Generate Tailored Cover Letter for Job Description",
+    GenerationMode.EMAIL_APPLICATION: "Generate and Send Job Application via Email",
+}
+
+_MODE_BY_DISPLAY_NAME: Dict[str, GenerationMode] = {name: m for m, name in _MODE_DISPLAY_NAMES.items()}
+_MODE_BY_CODE: Dict[str, GenerationMode] = {code: m for m, code in _MODE_CODES.items()}
+
+_JOB_URL_MODES = frozenset({
+    GenerationMode.TAILORED_RESUME,
+    GenerationMode.COVER_LETTER,
+    GenerationMode.EMAIL_APPLICATION,
+})
+
+
 # Convenience functions
 def validate_design_model(model_str: str) -> DesignModel:
     """
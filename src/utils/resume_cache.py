@@ -11,19 +11,27 @@ Usage:
     
     resume_text = load_resume_cached("data_folder/plain_text_resume.yaml")
     # Subsequent calls return cached version (instant)
+    # Editing the file invalidates the cache automatically (keyed on mtime + size)
 """
+from __future__ import annotations
+
+import mmap
+import os
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from loguru import logger
 
+# Files larger than this are decoded straight from a memory map
+MMAP_THRESHOLD_BYTES = 256 * 1024
+
 
-@lru_cache(maxsize=4)
 def load_resume_cached(resume_path: str) -> str:
     """
     Load resume file with caching.
     
-    Uses LRU cache to store the last 4 resume files in memory.
+    Uses LRU cache to store the last 4 resume files in memory, keyed on
+    (path, mtime_ns, size) so an edited file is re-read automatically.
     This eliminates redundant file I/O operations.
     
     Args:
@@ -37,18 +45,33 @@ def load_resume_cached(resume_path: str) -> str:
         
     Performance:
         First call: ~5ms (file I/O)
-        Cached calls: <0.1ms (memory lookup)
+        Cached calls: <0.1ms (one os.stat + memory lookup)
     """
-    path = Path(resume_path)
-    
-    if not path.exists():
+    try:
+        st = os.stat(resume_path)
+    except FileNotFoundError:
         logger.error(f"Resume file not found: {resume_path}")
         raise FileNotFoundError(f"Resume file not found: {resume_path}")
     
+    return _load_resume_impl(resume_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _load_resume_impl(resume_path: str, mtime_ns: int, size: int) -> str:
+    """Read the resume file; mtime_ns and size only take part in the cache key."""
+    path = Path(resume_path)
+    
     logger.debug(f"📖 Loading resume from: {resume_path}")
     
-    with open(path, 'r', encoding='utf-8') as file:
-        content = file.read()
+    if size > MMAP_THRESHOLD_BYTES:
+        # Decode directly from the mapping - avoids an intermediate bytes copy
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = str(mm, 'utf-8')
+        if '\r' in content:
+            # Match text-mode universal newline handling
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+    else:
+        content = path.read_text(encoding='utf-8')
     
     logger.info(f"✅ Resume loaded ({len(content)} bytes, cached)")
     return content
@@ -58,9 +81,9 @@ def clear_resume_cache():
     """
     Clear the resume cache.
     
-    Use this when you've updated the resume file and want to force a reload.
+    Edits are picked up automatically; use this to free memory or force a reload.
     """
-    load_resume_cached.cache_clear()
+    _load_resume_impl.cache_clear()
     logger.info("🧹 Resume cache cleared")
 
 
@@ -71,7 +94,7 @@ def get_cache_info():
     Returns:
         CacheInfo: Named tuple with hits, misses, maxsize, currsize
     """
-    return load_resume_cached.cache_info()
+    return _load_resume_impl.cache_info()
 
 
 # Export main functions
@@ -0,0 +1,114 @@
+"""
+Browser pool tests
+Tests for acquire/release, recycling and cleanup with a stubbed init_browser
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.utils import browser_pool
+from src.utils.browser_pool import BrowserPool
+
+
+@pytest.fixture
+def init_browser(monkeypatch):
+    """Fresh pool singleton whose drivers are mocks instead of real Chrome instances."""
+    monkeypatch.setattr(browser_pool, "POOL_SIZE", 2)
+    # Don't register exit hooks or signal handlers from the test process
+    monkeypatch.setattr(BrowserPool, "_exit_hooks_installed", True)
+    monkeypatch.setattr(BrowserPool, "_instance", None)
+    with patch("src.utils.chrome_utils.init_browser", side_effect=lambda **kwargs: MagicMock()) as mock:
+        yield mock
+        BrowserPool.get_instance().cleanup()
+
+
+class TestAcquireRelease:
+    """Test borrowing drivers from the pool"""
+
+    def test_released_driver_is_reused(self, init_browser):
+        """Test that a released driver is handed out again instead of spawning a new one"""
+        pool = BrowserPool.get_instance()
+
+        driver = pool.acquire()
+        pool.release(driver)
+
+        assert pool.acquire() is driver
+        init_browser.assert_called_once_with(headless=True)
+
+    def test_full_pool_times_out(self, init_browser):
+        """Test that acquire() gives up when every driver is checked out"""
+        pool = BrowserPool.get_instance()
+        pool.acquire()
+        pool.acquire()
+
+        with pytest.raises(RuntimeError, match="No browser available"):
+            pool.acquire(timeout=0.1)
+        assert init_browser.call_count == 2
+
+    def test_failed_spawn_frees_slot(self, init_browser):
+        """Test that a driver that fails to start does not use up a pool slot"""
+        pool = BrowserPool.get_instance()
+        init_browser.side_effect = [RuntimeError("no chrome"), MagicMock(), MagicMock()]
+
+        with pytest.raises(RuntimeError, match="no chrome"):
+            pool.acquire()
+
+        pool.acquire()
+        pool.acquire()
+        assert init_browser.call_count == 3
+
+    def test_driver_is_recycled_after_max_uses(self, init_browser, monkeypatch):
+        """Test that a driver is quit after MAX_USES_PER_INSTANCE releases"""
+        monkeypatch.setattr(browser_pool, "MAX_USES_PER_INSTANCE", 2)
+        pool = BrowserPool.get_instance()
+
+        driver = pool.acquire()
+        pool.release(driver)
+        assert pool.acquire() is driver
+        pool.release(driver)
+
+        driver.quit.assert_called_once()
+        assert pool.acquire() is not driver
+
+
+class TestSharedDriver:
+    """Test the long-lived driver from get_driver()"""
+
+    def test_shared_driver_does_not_block_acquire(self, init_browser, monkeypatch):
+        """Test that get_driver() leaves every pool slot free, even with POOL_SIZE=1"""
+        monkeypatch.setattr(browser_pool, "POOL_SIZE", 1)
+        pool = BrowserPool.get_instance()
+
+        shared = pool.get_driver()
+        driver = pool.acquire(timeout=0.1)
+
+        assert driver is not shared
+        assert pool.get_driver() is shared
+        init_browser.assert_any_call()
+
+
+class TestCleanup:
+    """Test closing all browser instances"""
+
+    def test_cleanup_quits_pooled_and_shared_drivers(self, init_browser):
+        """Test that cleanup() quits idle, checked-out and shared drivers"""
+        pool = BrowserPool.get_instance()
+        idle = pool.acquire()
+        busy = pool.acquire()
+        pool.release(idle)
+        shared = pool.get_driver()
+
+        pool.cleanup()
+
+        for driver in (idle, busy, shared):
+            driver.quit.assert_called_once()
+
+    def test_release_after_cleanup_is_ignored(self, init_browser):
+        """Test that a driver checked out during cleanup() is not put back in the pool"""
+        pool = BrowserPool.get_instance()
+        driver = pool.acquire()
+
+        pool.cleanup()
+        pool.release(driver)
+
+        assert pool.acquire() is not driver
+        assert pool.get_driver() is not driver
@@ -0,0 +1,208 @@
+"""
+Chrome utility tests
+Tests for HTML preprocessing (stylesheet inlining) before PDF rendering
+"""
+import http.server
+import socket
+import threading
+import pytest
+import responses
+from unittest.mock import Mock, patch
+
+from src.utils import chrome_utils
+from src.utils.chrome_utils import preprocess_html
+
+CSS_URL = "https://fonts.example.com/css/site.css"
+IMPORTED_URL = "https://fonts.example.com/css/extra.css"
+FONT_URL = "https://fonts.example.com/fonts/inter.woff2"
+
+ASSETS = {
+    CSS_URL: b"body { color: red; }",
+    IMPORTED_URL: b"h1 { font-weight: bold; }",
+    "https://fonts.example.com/css/fonts.css": b"@font-face { src: url(../fonts/inter.woff2); }",
+}
+
+
+@pytest.fixture
+def fetch_asset():
+    """Serve ASSETS instead of hitting the network; unknown URLs fail like a network error."""
+    chrome_utils._inline_stylesheet.cache_clear()
+    with patch.object(chrome_utils, "_fetch_asset", side_effect=ASSETS.get) as mock:
+        yield mock
+    chrome_utils._inline_stylesheet.cache_clear()
+
+
+class TestPreprocessHtml:
+    """Test inlining of external stylesheets"""
+
+    def test_link_stylesheet_is_inlined(self, fetch_asset):
+        """Test that <link rel="stylesheet"> is replaced by a <style> block"""
+        html = f'<head><link rel="stylesheet" href="{CSS_URL}"></head>'
+
+        result = preprocess_html(html)
+
+        assert result == "<head><style>body { color: red; }</style></head>"
+        fetch_asset.assert_called_once_with(CSS_URL)
+
+    def test_import_in_style_block_is_inlined(self, fetch_asset):
+        """Test that @import inside <style> is replaced by the imported CSS"""
+        html = f'<style>@import url("{IMPORTED_URL}"); p {{ margin: 0; }}</style>'
+
+        result = preprocess_html(html)
+
+        assert result == "<style>h1 { font-weight: bold; } p { margin: 0; }</style>"
+
+    def test_font_urls_are_made_absolute_not_fetched(self, fetch_asset):
+        """Test that fonts stay URLs for Chrome to fetch (only the subsets it needs)"""
+        html = '<link rel="stylesheet" href="https://fonts.example.com/css/fonts.css">'
+
+        result = preprocess_html(html)
+
+        assert result == f'<style>@font-face {{ src: url("{FONT_URL}"); }}</style>'
+        fetch_asset.assert_called_once_with("https://fonts.example.com/css/fonts.css")
+
+    @pytest.mark.parametrize("media", ["print", "screen", "(max-width: 600px)"])
+    def test_link_with_media_attribute_is_kept(self, fetch_asset, media):
+        """Test that media-specific stylesheets are not inlined as if they applied everywhere"""
+        html = f'<link rel="stylesheet" href="{CSS_URL}" media="{media}">'
+
+        assert preprocess_html(html) == html
+        fetch_asset.assert_not_called()
+
+    def test_link_with_media_all_is_inlined(self, fetch_asset):
+        """Test that media="all" behaves like no media attribute"""
+        html = f'<link rel="stylesheet" href="{CSS_URL}" media="all">'
+
+        assert preprocess_html(html) == "<style>body { color: red; }</style>"
+
+    def test_fetch_failure_leaves_markup_untouched(self, fetch_asset):
+        """Test that resources which cannot be fetched are left as they were"""
+        html = (
+            '<link rel="stylesheet" href="https://fonts.example.com/missing.css">'
+            '<style>@import url(https://fonts.example.com/missing2.css);</style>'
+        )
+
+        assert preprocess_html(html) == html
+
+    def test_import_in_body_text_is_not_fetched(self, fetch_asset):
+        """Test that @import in body text (job ads, LLM output) is never fetched or spliced in"""
+        html = f"<body><p>@import url({IMPORTED_URL});</p></body>"
+
+        assert preprocess_html(html) == html
+        fetch_asset.assert_not_called()
+
+    def test_inlined_css_cannot_close_style_block(self, fetch_asset):
+        """Test that a fetched stylesheet cannot break out of its <style> element"""
+        assets = {CSS_URL: b"a{}</style><img src=x>"}
+        fetch_asset.side_effect = assets.get
+
+        result = preprocess_html(f'<link rel="stylesheet" href="{CSS_URL}">')
+
+        assert result.count("</style>") == 1
+        assert result.endswith("</style>")
+
+
+class TestAssetUrlValidation:
+    """Test SSRF protection for asset fetches"""
+
+    def test_dns_name_resolving_to_internal_ip_is_rejected(self):
+        """Test that hostnames resolving to private addresses are not fetched"""
+        internal = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.5", 0))]
+        with patch("socket.getaddrinfo", return_value=internal):
+            assert chrome_utils._is_allowed_asset_url("https://intranet.example.com/a.css") is False
+
+    def test_dns_name_resolving_to_public_ip_is_allowed(self):
+        """Test that hostnames resolving to public addresses may be fetched"""
+        public = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+        with patch("socket.getaddrinfo", return_value=public):
+            assert chrome_utils._is_allowed_asset_url("https://cdn.example.com/a.css") is True
+
+    def test_unresolvable_host_is_rejected(self):
+        """Test that hosts that do not resolve are not fetched"""
+        with patch("socket.getaddrinfo", side_effect=socket.gaierror("no such host")):
+            assert chrome_utils._is_allowed_asset_url("https://nowhere.invalid/a.css") is False
+
+
+PUBLIC_ADDRINFO = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+
+
+@pytest.fixture
+def http_mock():
+    """Mock HTTP for _fetch_asset; the host resolves to, and connects from, a public IP."""
+    chrome_utils._fetch_asset.cache_clear()
+    with responses.RequestsMock() as rsps, \
+            patch("socket.getaddrinfo", return_value=PUBLIC_ADDRINFO), \
+            patch.object(chrome_utils, "_connected_ip", return_value="93.184.216.34"):
+        yield rsps
+    chrome_utils._fetch_asset.cache_clear()
+
+
+class TestFetchAsset:
+    """Test the server-side fetch of stylesheets to inline"""
+
+    def test_public_asset_is_fetched(self, http_mock):
+        """Test that a small public stylesheet is returned"""
+        http_mock.add(responses.GET, CSS_URL, body=b"body{}", status=200)
+
+        assert chrome_utils._fetch_asset(CSS_URL) == b"body{}"
+
+    def test_redirect_is_not_followed(self, http_mock):
+        """Test that a redirect (possibly to an internal address) is treated as a failure"""
+        http_mock.add(
+            responses.GET, CSS_URL, status=302,
+            headers={"Location": "http://169.254.169.254/latest/meta-data"},
+        )
+
+        assert chrome_utils._fetch_asset(CSS_URL) is None
+        assert len(http_mock.calls) == 1
+
+    def test_oversized_response_is_rejected(self, http_mock):
+        """Test that bodies over MAX_ASSET_BYTES are not returned"""
+        http_mock.add(responses.GET, CSS_URL, body=b"a" * (chrome_utils.MAX_ASSET_BYTES + 1), status=200)
+
+        assert chrome_utils._fetch_asset(CSS_URL) is None
+
+    def test_rebinding_to_internal_address_is_rejected(self):
+        """Test that a host resolving publicly at check time but connecting internally is blocked"""
+        server = http.server.HTTPServer(("127.0.0.1", 0), http.server.SimpleHTTPRequestHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        loopback = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", server.server_port))]
+        chrome_utils._fetch_asset.cache_clear()
+        try:
+            # First lookup is the validation, the second one is urllib3 connecting
+            with patch("socket.getaddrinfo", side_effect=[PUBLIC_ADDRINFO, loopback]):
+                url = f"http://rebind.example.com:{server.server_port}/"
+                assert chrome_utils._fetch_asset(url) is None
+        finally:
+            server.shutdown()
+            server.server_close()
+            chrome_utils._fetch_asset.cache_clear()
+
+
+class TestWaitUntilRendered:
+    """Test that the readyState and font waits share one timeout"""
+
+    def test_font_wait_gets_remaining_time(self):
+        """Test that the font wait is only given what is left of the timeout"""
+        driver = Mock()
+        driver.execute_script.return_value = "complete"
+        clock = Mock()
+        clock.monotonic.side_effect = [100.0, 104.0]
+
+        with patch.object(chrome_utils, "time", clock):
+            chrome_utils._wait_until_rendered(driver, timeout=10)
+
+        driver.set_script_timeout.assert_called_once_with(6.0)
+
+    def test_font_wait_skipped_when_deadline_passed(self):
+        """Test that no font wait is started once the shared timeout is used up"""
+        driver = Mock()
+        driver.execute_script.return_value = "complete"
+        clock = Mock()
+        clock.monotonic.side_effect = [100.0, 111.0]
+
+        with patch.object(chrome_utils, "time", clock):
+            chrome_utils._wait_until_rendered(driver, timeout=10)
+
+        driver.set_script_timeout.assert_not_called()
+        driver.execute_async_script.assert_not_called()
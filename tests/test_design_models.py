@@ -0,0 +1,27 @@
+"""
+Design model enum tests
+Tests for int-backed DesignModel/GenerationMode and their string codes
+"""
+import json
+
+from src.utils.design_models import DesignModel, GenerationMode
+
+
+class TestDesignModelEnums:
+    """Test enum values and serialization codes"""
+
+    def test_all_members_are_truthy(self):
+        """Test that no member is falsy (e.g. `if model:` with ORIGINAL)"""
+        assert all(DesignModel)
+        assert all(GenerationMode)
+
+    def test_enums_do_not_compare_equal(self):
+        """Test that design models and generation modes never collide as ints"""
+        assert not {int(m) for m in DesignModel} & {int(m) for m in GenerationMode}
+
+    def test_code_round_trips_through_json(self):
+        """Test that persisting .code restores the same member"""
+        for model in DesignModel:
+            assert DesignModel.from_string(json.loads(json.dumps(model.code))) is model
+        for mode in GenerationMode:
+            assert GenerationMode.from_string(json.loads(json.dumps(mode.code))) is mode
@@ -4,10 +4,12 @@ Integration tests for main.py helper functions.
 Tests validate_personal_info, load_resume_file, and other critical functions.
 Increases test coverage for main.py from 8% to 50%+.
 """
+import copy
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from main import (
+    ConfigValidator,
     validate_personal_info,
     load_resume_file,
     get_browser_instance,
@@ -15,67 +17,46 @@ from main import (
 )
 
 
+# Complete resume structure; tests mutate copies of it, never the template itself
+_VALID_RESUME_TEMPLATE = {
+    'plain_text': 'John Doe\nSoftware Engineer\n...',
+    'personal_info': {
+        'name': 'John Doe',
+        'email': 'john.doe@example.com',
+        'phone': '+46 70 123 4567',
+        'location': 'Stockholm, Sweden'
+    },
+    'skills': ['Python', 'Testing', 'CI/CD'],
+    'education': [
+        {'degree': 'BSc Computer Science', 'university': 'KTH', 'year': '2020'}
+    ],
+    'work_experience': [
+        {'title': 'Software Developer', 'company': 'TechCorp', 'years': '2020-2023'}
+    ]
+}
+
+
 class TestValidatePersonalInfo:
     """Test resume validation functionality."""
 
     @pytest.fixture
     def valid_resume_data(self):
-        """Fixture providing valid resume data structure."""
-        return {
-            'plain_text': 'John Doe\nSoftware Engineer\n...',
-            'personal_info': {
-                'name': 'John Doe',
-                'email': 'john.doe@example.com',
-                'phone': '+46 70 123 4567',
-                'location': 'Stockholm, Sweden'
-            },
-            'skills': ['Python', 'Testing', 'CI/CD'],
-            'education': [
-                {'degree': 'BSc Computer Science', 'university': 'KTH', 'year': '2020'}
-            ],
-            'work_experience': [
-                {'title': 'Software Developer', 'company': 'TechCorp', 'years': '2020-2023'}
-            ]
-        }
+        """Fixture providing valid resume data structure (a fresh copy per test)."""
+        return copy.deepcopy(_VALID_RESUME_TEMPLATE)
 
     def test_validate_valid_resume(self, valid_resume_data):
         """Test validation passes for complete, valid resume."""
         result = validate_personal_info(valid_resume_data)
         assert result is True
 
-    def test_validate_missing_plain_text(self, valid_resume_data):
-        """Test validation fails when plain_text field is missing."""
-        del valid_resume_data['plain_text']
-
-        with pytest.raises(ValueError, match="Resume data missing required fields: plain_text"):
-            validate_personal_info(valid_resume_data)
-
-    def test_validate_missing_personal_info(self, valid_resume_data):
-        """Test validation fails when personal_info field is missing."""
-        del valid_resume_data['personal_info']
-
-        with pytest.raises(ValueError, match="Resume data missing required fields: personal_info"):
-            validate_personal_info(valid_resume_data)
-
-    def test_validate_missing_skills(self, valid_resume_data):
-        """Test validation fails when skills field is missing."""
-        del valid_resume_data['skills']
+    @pytest.mark.parametrize("field", [
+        'plain_text', 'personal_info', 'skills', 'education', 'work_experience'
+    ])
+    def test_validate_missing_top_field(self, valid_resume_data, field):
+        """Test validation fails when a required top-level field is missing."""
+        del valid_resume_data[field]
 
-        with pytest.raises(ValueError, match="Resume data missing required fields: skills"):
-            validate_personal_info(valid_resume_data)
-
-    def test_validate_missing_education(self, valid_resume_data):
-        """Test validation fails when education field is missing."""
-        del valid_resume_data['education']
-
-        with pytest.raises(ValueError, match="Resume data missing required fields: education"):
-            validate_personal_info(valid_resume_data)
-
-    def test_validate_missing_work_experience(self, valid_resume_data):
-        """Test validation fails when work_experience field is missing."""
-        del valid_resume_data['work_experience']
-
-        with pytest.raises(ValueError, match="Resume data missing required fields: work_experience"):
+        with pytest.raises(ValueError, match=f"Resume data missing required fields: {field}"):
             validate_personal_info(valid_resume_data)
 
     def test_validate_multiple_missing_fields(self, valid_resume_data):
@@ -90,18 +71,12 @@ class TestValidatePersonalInfo:
         assert "skills" in error_message
         assert "education" in error_message
 
-    def test_validate_missing_name_in_personal_info(self, valid_resume_data):
-        """Test validation fails when name is missing from personal_info."""
-        del valid_resume_data['personal_info']['name']
+    @pytest.mark.parametrize("field", ['name', 'email'])
+    def test_validate_missing_personal_info_field(self, valid_resume_data, field):
+        """Test validation fails when a required field is missing from personal_info."""
+        del valid_resume_data['personal_info'][field]
 
-        with pytest.raises(ValueError, match="Personal info missing required fields: name"):
-            validate_personal_info(valid_resume_data)
-
-    def test_validate_missing_email_in_personal_info(self, valid_resume_data):
-        """Test validation fails when email is missing from personal_info."""
-        del valid_resume_data['personal_info']['email']
-
-        with pytest.raises(ValueError, match="Personal info missing required fields: email"):
+        with pytest.raises(ValueError, match=f"Personal info missing required fields: {field}"):
             validate_personal_info(valid_resume_data)
 
     def test_validate_invalid_email_format(self, valid_resume_data):
@@ -131,30 +106,54 @@ class TestValidatePersonalInfo:
             assert "email" in str(e).lower()
 
 
+RESUME_CONTENT = "John Doe\nSoftware Engineer\nExperience: 5 years Python"
+RESUME_CONTENT_SV = "Anders Andersson\nStockholm, Sverige\nFörfattare och utvecklare"
+
+
+@pytest.fixture(scope="session")
+def resume_dir(tmp_path_factory):
+    """Directory holding the static resume files, created once per session."""
+    return tmp_path_factory.mktemp("resumes")
+
+
+@pytest.fixture(scope="session")
+def resume_file(resume_dir):
+    """Plain resume file, written once per session."""
+    path = resume_dir / "resume.txt"
+    path.write_text(RESUME_CONTENT, encoding='utf-8')
+    return path
+
+
+@pytest.fixture(scope="session")
+def swedish_resume_file(resume_dir):
+    """Resume with Swedish characters, written once per session."""
+    path = resume_dir / "resume_swedish.txt"
+    path.write_text(RESUME_CONTENT_SV, encoding='utf-8')
+    return path
+
+
+@pytest.fixture(scope="session")
+def empty_resume_file(resume_dir):
+    """Empty resume file, written once per session."""
+    path = resume_dir / "empty_resume.txt"
+    path.write_text("", encoding='utf-8')
+    return path
+
+
 class TestLoadResumeFile:
     """Test resume file loading functionality."""
 
-    def test_load_resume_success(self, tmp_path):
+    def test_load_resume_success(self, resume_file):
         """Test successfully loading a resume file."""
-        # Create temporary resume file
-        resume_file = tmp_path / "resume.txt"
-        resume_content = "John Doe\nSoftware Engineer\nExperience: 5 years Python"
-        resume_file.write_text(resume_content, encoding='utf-8')
-
-        # Load resume
         content = load_resume_file(resume_file)
 
-        assert content == resume_content
+        assert content == RESUME_CONTENT
         assert "John Doe" in content
         assert "Python" in content
 
-    def test_load_resume_with_utf8_characters(self, tmp_path):
+    def test_load_resume_with_utf8_characters(self, swedish_resume_file):
         """Test loading resume with UTF-8 characters (Swedish etc)."""
-        resume_file = tmp_path / "resume_swedish.txt"
-        resume_content = "Anders Andersson\nStockholm, Sverige\nFörfattare och utvecklare"
-        resume_file.write_text(resume_content, encoding='utf-8')
-
-        content = load_resume_file(resume_file)
+        content = load_resume_file(swedish_resume_file)
 
         assert "Anders Andersson" in content
         assert "Sverige" in content
@@ -167,27 +166,21 @@ class TestLoadResumeFile:
         with pytest.raises(FileNotFoundError):
             load_resume_file(non_existent_file)
 
-    def test_load_resume_empty_file(self, tmp_path):
+    def test_load_resume_empty_file(self, empty_resume_file):
         """Test loading empty resume file."""
-        resume_file = tmp_path / "empty_resume.txt"
-        resume_file.write_text("", encoding='utf-8')
-
-        content = load_resume_file(resume_file)
+        content = load_resume_file(empty_resume_file)
 
         assert content == ""
 
     @patch('main.REFACTORED_MODULES_AVAILABLE', True)
     @patch('main.load_resume_cached')
-    def test_load_resume_uses_cache_when_available(self, mock_load_cached, tmp_path):
+    def test_load_resume_uses_cache_when_available(self, mock_load_cached, resume_file):
         """Test that caching is used when refactored modules are available."""
-        resume_file = tmp_path / "resume_cached.txt"
-        resume_file.write_text("Cached content", encoding='utf-8')
-
-        mock_load_cached.return_value = "Cached content"
+        mock_load_cached.return_value = RESUME_CONTENT
 
         content = load_resume_file(resume_file)
 
-        assert content == "Cached content"
+        assert content == RESUME_CONTENT
         mock_load_cached.assert_called_once_with(str(resume_file))
 
 
@@ -222,65 +215,22 @@ class TestGetBrowserInstance:
 class TestValidateAndGetJobUrl:
     """Test job URL validation and prompt."""
 
-    @patch('inquirer.prompt')
-    @patch('main.SECURITY_ENABLED', True)
-    def test_validate_and_get_job_url_valid(self, mock_prompt):
-        """Test successful URL validation."""
-        mock_prompt.return_value = {'job_url': 'https://www.linkedin.com/jobs/view/123'}
-
-        result = validate_and_get_job_url()
-
-        assert result == 'https://www.linkedin.com/jobs/view/123'
-
-    @patch('inquirer.prompt')
-    def test_validate_and_get_job_url_empty(self, mock_prompt):
-        """Test handling of empty URL input."""
-        mock_prompt.return_value = {'job_url': ''}
-
-        result = validate_and_get_job_url()
-
-        assert result is None
-
-    @patch('inquirer.prompt')
-    def test_validate_and_get_job_url_none(self, mock_prompt):
-        """Test handling of None URL input."""
-        mock_prompt.return_value = {'job_url': None}
-
-        result = validate_and_get_job_url()
-
-        assert result is None
-
-    @patch('inquirer.prompt')
-    @patch('main.SECURITY_ENABLED', True)
-    def test_validate_and_get_job_url_rejects_localhost(self, mock_prompt):
-        """Test URL validation rejects localhost."""
-        mock_prompt.return_value = {'job_url': 'http://localhost/jobs/123'}
-
-        result = validate_and_get_job_url()
-
-        # Should return None for invalid URL
-        assert result is None
-
-    @patch('inquirer.prompt')
-    @patch('main.SECURITY_ENABLED', True)
-    def test_validate_and_get_job_url_rejects_private_ip(self, mock_prompt):
-        """Test URL validation rejects private IP addresses."""
-        mock_prompt.return_value = {'job_url': 'http://192.168.1.1/jobs'}
-
-        result = validate_and_get_job_url()
-
-        assert result is None
-
-    @patch('inquirer.prompt')
-    @patch('main.SECURITY_ENABLED', False)
-    def test_validate_and_get_job_url_when_security_disabled(self, mock_prompt):
-        """Test that URL is accepted when security validation is disabled."""
-        mock_prompt.return_value = {'job_url': 'http://localhost/jobs'}
-
-        result = validate_and_get_job_url()
-
+    @pytest.mark.parametrize("url, security, expected", [
+        pytest.param('https://www.linkedin.com/jobs/view/123', True,
+                     'https://www.linkedin.com/jobs/view/123', id="valid"),
+        pytest.param('', True, None, id="empty"),
+        pytest.param(None, True, None, id="none"),
+        pytest.param('http://localhost/jobs/123', True, None, id="rejects-localhost"),
+        pytest.param('http://192.168.1.1/jobs', True, None, id="rejects-private-ip"),
         # When security is disabled, URL should be returned as-is
-        assert result == 'http://localhost/jobs'
+        pytest.param('http://localhost/jobs', False, 'http://localhost/jobs', id="security-disabled"),
+    ])
+    def test_validate_and_get_job_url(self, monkeypatch, url, security, expected):
+        """Test URL prompt handling and validation."""
+        monkeypatch.setattr('main.SECURITY_ENABLED', security)
+        monkeypatch.setattr('inquirer.prompt', lambda questions: {'job_url': url})
+
+        assert validate_and_get_job_url() == expected
 
 
 class TestConfigValidator:
@@ -288,8 +238,6 @@ class TestConfigValidator:
 
     def test_config_validator_imports(self):
         """Test that ConfigValidator can be imported."""
-        from main import ConfigValidator
-
         assert hasattr(ConfigValidator, 'EMAIL_REGEX')
         assert hasattr(ConfigValidator, 'REQUIRED_CONFIG_KEYS')
         assert hasattr(ConfigValidator, 'EXPERIENCE_LEVELS')
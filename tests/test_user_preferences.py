@@ -0,0 +1,93 @@
+"""
+User preferences tests
+Tests for the cached, file-backed preference store
+"""
+import os
+import stat
+import sys
+import pytest
+from unittest.mock import patch
+
+from src.user_preferences import UserPreferences
+
+
+@pytest.fixture
+def prefs_file(tmp_path, monkeypatch):
+    """Point UserPreferences at a fresh file with an empty cache."""
+    path = tmp_path / "user_preferences.json"
+    monkeypatch.setattr(UserPreferences, "PREFERENCES_FILE", path)
+    UserPreferences._invalidate_cache()
+    yield path
+    UserPreferences._invalidate_cache()
+
+
+class TestUserPreferences:
+    """Test preference caching and change detection"""
+
+    def test_mutating_returned_value_then_set_is_saved(self, prefs_file):
+        """Test that set() persists a nested value the caller mutated in place"""
+        UserPreferences.set("recent", ["a"])
+
+        recent = UserPreferences.get("recent")
+        recent.append("b")
+        assert UserPreferences.set("recent", recent) is True
+
+        UserPreferences._invalidate_cache()
+        assert UserPreferences.get("recent") == ["a", "b"]
+
+    def test_load_returns_independent_copy(self, prefs_file):
+        """Test that mutating a loaded dict does not change the cache"""
+        UserPreferences.save({"nested": {"k": [1]}})
+
+        UserPreferences.load()["nested"]["k"].append(2)
+
+        assert UserPreferences.get("nested") == {"k": [1]}
+
+    def test_external_change_invalidates_cache(self, prefs_file):
+        """Test that a file changed on disk is re-read instead of served from cache"""
+        UserPreferences.save({"design": "a"})
+        assert UserPreferences.get("design") == "a"
+
+        prefs_file.write_text('{"design": "bb"}', encoding="utf-8")
+        st = prefs_file.stat()
+        os.utime(prefs_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert UserPreferences.get("design") == "bb"
+
+    def test_set_same_value_skips_save(self, prefs_file):
+        """Test that setting an unchanged value does not write the file"""
+        UserPreferences.set("design", "a")
+
+        with patch.object(UserPreferences, "save") as mock_save:
+            assert UserPreferences.set("design", "a") is True
+            assert UserPreferences.update({"design": "a"}) is True
+
+        mock_save.assert_not_called()
+
+    def test_update_writes_once(self, prefs_file):
+        """Test that update() saves several changed keys with a single write"""
+        with patch.object(UserPreferences, "save", return_value=True) as mock_save:
+            UserPreferences.update({"a": 1, "b": 2})
+
+        mock_save.assert_called_once_with({"a": 1, "b": 2})
+
+    def test_save_leaves_no_temp_files(self, prefs_file):
+        """Test that saves go through a unique temp file that is always cleaned up"""
+        assert UserPreferences.save({"design": "a"}) is True
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            assert UserPreferences.save({"design": "b"}) is False
+
+        assert [p.name for p in prefs_file.parent.iterdir()] == [prefs_file.name]
+        assert UserPreferences.get("design") == "a"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+    def test_save_keeps_file_permissions(self, prefs_file):
+        """Test that saving does not silently change the file's mode"""
+        UserPreferences.save({"design": "a"})
+        assert stat.S_IMODE(prefs_file.stat().st_mode) == 0o644
+
+        prefs_file.chmod(0o640)
+        UserPreferences.save({"design": "b"})
+
+        assert stat.S_IMODE(prefs_file.stat().st_mode) == 0o640
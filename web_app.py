@@ -30,6 +30,7 @@ import re
 import json
 import yaml
 import shutil
+import tempfile
 import threading
 import queue
 import time
@@ -298,20 +299,49 @@ def get_current_model_config() -> dict:
 # HELPERS
 # ============================================================
 
+# libyaml-baserade C-laddare/dumpare när de finns (betydligt snabbare), annars ren Python
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+
 def load_yaml(path):
     """Load YAML file safely"""
     try:
         with open(path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_YamlLoader) or {}
     except Exception:
         return {}
 
 
 def save_yaml(path, data):
-    """Save YAML file with unicode support"""
-    with open(path, 'w', encoding='utf-8') as f:
-        yaml.dump(data, f, allow_unicode=True, default_flow_style=False,
-                  sort_keys=False, indent=2)
+    """Save YAML file with unicode support (atomically via temp file + rename)"""
+    path = Path(path)
+    text = yaml.dump(data, Dumper=_YamlDumper, allow_unicode=True,
+                     default_flow_style=False, sort_keys=False, indent=2)
+    # Oförändrat innehåll skrivs inte om (ingen mtime-ändring eller onödig disk-I/O)
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return
+    except (OSError, UnicodeDecodeError):
+        pass
+    # Unikt temp-namn i samma katalog: samtidiga anrop skriver aldrig över varandras temp-fil
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # mkstemp skapar filen med 0600 - behåll målfilens rättigheter
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        # Ett avbrutet skrivförsök lämnar aldrig en halvskriven fil
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
 
 
 def load_json(path):